@@ -23,7 +23,11 @@ from pandas import *
 
 import kale.utils.logger as logging
 from kale.embed.uncertainty_fitting import fit_and_predict
-from kale.interpret.uncertainty_quantiles import generate_fig_comparing_bins, generate_fig_individual_bin_comparison
+from kale.interpret.uncertainty_quantiles import (
+    generate_fig_comparing_bins,
+    generate_fig_individual_bin_comparison,
+    QBinComparisonData,
+)
 from kale.utils.download import download_file_by_url
 
 warnings.filterwarnings("error")
@@ -225,27 +229,27 @@ def main():
 
                         logger.info("Comparison Q figures for: %s and %s ", c_model, c_er_pair)
                         generate_fig_comparing_bins(
-                            data=[
-                                c_er_pair,
-                                c_model,
-                                dataset,
-                                landmarks,
-                                cfg.PIPELINE.NUM_QUANTILE_BINS,
-                                cmaps,
-                                all_fitted_save_paths,
-                                save_folder_comparison,
-                                save_file_preamble,
-                                cfg["PIPELINE"]["COMBINE_MIDDLE_BINS"],
-                                cfg["OUTPUT"]["SAVE_FIGURES"],
-                                cfg["BOXPLOT"]["SAMPLES_AS_DOTS"],
-                                cfg["BOXPLOT"]["SHOW_SAMPLE_INFO_MODE"],
-                                cfg["BOXPLOT"]["ERROR_LIM"],
-                                show_individual_landmark_plots,
-                                interpret,
-                                num_folds,
-                                ind_landmarks_to_show,
-                                pixel_to_mm_scale,
-                            ],
+                            data=QBinComparisonData(
+                                uncertainty_error_pair=c_er_pair,
+                                model=c_model,
+                                dataset=dataset,
+                                targets=landmarks,
+                                all_values_q=cfg.PIPELINE.NUM_QUANTILE_BINS,
+                                cmaps=cmaps,
+                                all_fitted_save_paths=all_fitted_save_paths,
+                                save_folder=save_folder_comparison,
+                                save_file_preamble=save_file_preamble,
+                                combine_middle_bins=cfg["PIPELINE"]["COMBINE_MIDDLE_BINS"],
+                                save_figures_bool=cfg["OUTPUT"]["SAVE_FIGURES"],
+                                samples_as_dots_bool=cfg["BOXPLOT"]["SAMPLES_AS_DOTS"],
+                                show_sample_info_mode=cfg["BOXPLOT"]["SHOW_SAMPLE_INFO_MODE"],
+                                box_plot_error_lim=cfg["BOXPLOT"]["ERROR_LIM"],
+                                show_individual_target_plots=show_individual_landmark_plots,
+                                interpret=interpret,
+                                num_folds=num_folds,
+                                ind_targets_to_show=ind_landmarks_to_show,
+                                error_scaling_factor=pixel_to_mm_scale,
+                            ),
                             display_settings={
                                 "cumulative_error": True,
                                 "errors": True,
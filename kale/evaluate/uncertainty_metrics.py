@@ -10,15 +10,194 @@ Functions related to  evaluating the quantile binning method in terms of:
 
 """
 
-from typing import Dict, List
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from sklearn.utils.parallel import delayed, Parallel
 
-from kale.evaluate.similarity_metrics import jaccard_similarity
 from kale.prepdata.string_transform import strip_for_bound
 
 
+def _split_folds(data_structs: pd.DataFrame, num_folds: int, uncertainty_pairs: List) -> List[pd.DataFrame]:
+    """
+    Splits a model's DataFrame into one DataFrame per testing fold, keeping only the columns of the evaluated
+    uncertainty types. The predicted bins are downcast to the smallest integer dtype that holds them.
+
+    Args:
+        data_structs (pd.DataFrame): DataFrame of errors and predicted bins for all folds of a model.
+        num_folds (int): Number of folds.
+        uncertainty_pairs (List): List of uncertainty pairs to be evaluated, the first element being the name.
+
+    Returns:
+        List[pd.DataFrame]: The rows of each fold in range(num_folds) (empty if the fold has no rows).
+    """
+    bins_cols = list(dict.fromkeys(pair[0] + " Uncertainty bins" for pair in uncertainty_pairs))
+    error_cols = list(dict.fromkeys(pair[0] + " Error" for pair in uncertainty_pairs))
+
+    data_structs = data_structs[["uid", "target_idx", "Testing Fold"] + error_cols + bins_cols]
+    downcast_bins = {col: pd.to_numeric(data_structs[col], downcast="integer") for col in bins_cols}
+    data_structs = data_structs.assign(**downcast_bins)
+    fold_frames = dict(iter(data_structs.groupby("Testing Fold")))
+    empty = data_structs.iloc[:0]
+
+    return [fold_frames.get(fold, empty) for fold in range(num_folds)]
+
+
+def _extract_fold_data(fold_data: pd.DataFrame, error_col: str, bins_col: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Selects the errors and predicted bins of one uncertainty type from a single fold's DataFrame.
+
+    Args:
+        fold_data (pd.DataFrame): DataFrame of errors and predicted bins for a single fold, from `_split_folds`.
+        error_col (str): Name of the error column, e.g. "S-MHA Error".
+        bins_col (str): Name of the predicted bins column, e.g. "S-MHA Uncertainty bins".
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: The fold errors (uid, target_idx, error) and the fold predicted bins
+        (uid, target_idx, bins).
+    """
+    return fold_data[["uid", "target_idx", error_col]], fold_data[["uid", "target_idx", bins_col]]
+
+
+def _split_target_arrays(
+    fold_errors: pd.DataFrame, fold_bins: pd.DataFrame, error_col: str, bins_col: str, targets: List[int]
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Materializes a fold's error and predicted bin columns as NumPy arrays once, and slices them per target with
+    the row positions of a single groupby pass instead of indexing the DataFrames again for every target.
+
+    Args:
+        fold_errors (pd.DataFrame): DataFrame of errors (uid, target_idx, error) for a single fold.
+        fold_bins (pd.DataFrame): DataFrame of predicted bins (uid, target_idx, bins) for the same rows.
+        error_col (str): Name of the error column.
+        bins_col (str): Name of the predicted bins column.
+        targets (List[int]): List of targets, giving the order of the returned arrays.
+
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray]]: The errors and predicted bins of each target (empty if the target has no
+        rows in this fold).
+    """
+    key_cols = ["uid", "target_idx"]
+    if not fold_errors[key_cols].equals(fold_bins[key_cols]):
+        # The rows of the two frames differ, so align the predicted bins to the errors by uid and target
+        fold_errors = fold_errors.merge(fold_bins[key_cols + [bins_col]], on=key_cols)
+        fold_bins = fold_errors
+
+    errors_arr = fold_errors[error_col].to_numpy()
+    # Predicted bins are compared as integers from here on
+    bins_arr = fold_bins[bins_col].to_numpy(dtype=np.int64)
+
+    target_rows = fold_errors.groupby("target_idx").indices
+    no_rows = np.empty(0, dtype=np.intp)
+
+    target_arrays = []
+    for target_idx in targets:
+        rows = target_rows.get(target_idx, no_rows)
+        target_arrays.append((errors_arr[rows], bins_arr[rows]))
+
+    return target_arrays
+
+
+def _append_per_bin(bin_lists: List[list], fold_values: list) -> None:
+    """
+    Appends one fold's value for each bin to the matching per-bin list.
+
+    Args:
+        bin_lists (List[list]): Accumulator with one list per bin.
+        fold_values (list): The fold's value for each bin.
+    """
+    for bin_list, value in zip(bin_lists, fold_values):
+        bin_list.append(value)
+
+
+def _extend_per_bin(bin_lists: List[list], fold_values: Iterable) -> None:
+    """
+    Extends each per-bin list with one fold's values for that bin.
+
+    Args:
+        bin_lists (List[list]): Accumulator with one list per bin.
+        fold_values (Iterable): The fold's values for each bin, as one iterable per bin.
+    """
+    for bin_list, values in zip(bin_lists, fold_values):
+        bin_list.extend(values)
+
+
+def _accumulate_targets_sep(
+    fold_results: List[List[list]],
+    targets_sep_foldwise: List[List[list]],
+    targets_sep_all: List[List[list]],
+    unwrap_all: bool = False,
+) -> None:
+    """
+    Adds one fold's target separated results to the foldwise and all-folds accumulators in a single pass over
+    targets and bins. All three arguments are indexed [target][bin].
+
+    Args:
+        fold_results (List[List[list]]): The fold's "all bins concatenated targets seperated" results.
+        targets_sep_foldwise (List[List[list]]): Accumulator extended with the fold's results as they are.
+        targets_sep_all (List[List[list]]): Accumulator extended with the fold's results flattened over folds.
+        unwrap_all (bool): If True, each non-empty result holds a single list whose elements are added to
+            targets_sep_all, rather than the result itself. Defaults to False.
+    """
+    for target_results, target_foldwise, target_all in zip(fold_results, targets_sep_foldwise, targets_sep_all):
+        for bin_results, bin_foldwise, bin_all in zip(target_results, target_foldwise, target_all):
+            bin_foldwise.extend(bin_results)
+            if not unwrap_all:
+                bin_all.extend(bin_results)
+            elif bin_results:
+                bin_all.extend(bin_results[0])
+
+
+def _bound_accuracy(
+    target_arrays: List[Tuple[np.ndarray, np.ndarray]], fold_bounds_all_targets: list, num_bins: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes, for every target at once, the fraction of samples in each predicted bin whose error falls within that
+    bin's estimated error bounds. The samples of all targets are stacked, tested in one pass and counted per
+    (target, bin) pair with np.bincount on a flat target * num_bins + bin key.
+
+    Args:
+        target_arrays (List[Tuple[np.ndarray, np.ndarray]]): The errors and predicted (integer) bins of each target,
+            as returned by _split_target_arrays.
+        fold_bounds_all_targets (list): The estimated error bounds of each target from B1 -> B5, i.e. the upper bound
+            of every bin but the last.
+        num_bins (int): The number of quantile bins.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The accuracy and the number of samples of each bin, as (num_targets, num_bins)
+        arrays.
+    """
+    num_targets = len(target_arrays)
+    if not num_targets:
+        return np.zeros((0, num_bins)), np.zeros((0, num_bins), dtype=np.int64)
+
+    # Stack the samples of all targets, remembering which target each sample belongs to
+    target_pos = np.repeat(np.arange(num_targets), [len(errors) for errors, _ in target_arrays])
+    errors = np.concatenate([errors for errors, _ in target_arrays])
+    bins = np.concatenate([bins for _, bins in target_arrays])
+
+    # If bin=0 then lower bound = 0, if bin=Q then no upper bound
+    bounds = np.array(
+        [fold_bounds[: num_bins - 1] for fold_bounds in fold_bounds_all_targets[:num_targets]], dtype=float
+    ).reshape(num_targets, num_bins - 1)
+    lower_bounds = np.hstack([np.zeros((num_targets, 1)), bounds])
+    upper_bounds = np.hstack([bounds, np.full((num_targets, 1), np.inf)])
+
+    # Test every sample against the bounds of its target and predicted bin at once, then count per (target, bin)
+    in_bins = (bins >= 0) & (bins < num_bins)
+    target_pos, bin_ids, errors = target_pos[in_bins], bins[in_bins], errors[in_bins]
+    is_correct = (errors > lower_bounds[target_pos, bin_ids]) & (errors <= upper_bounds[target_pos, bin_ids])
+
+    flat_ids = target_pos * num_bins + bin_ids
+    bins_sizes = np.bincount(flat_ids, minlength=num_targets * num_bins).reshape(num_targets, num_bins)
+    bins_correct = np.bincount(flat_ids[is_correct], minlength=num_targets * num_bins).reshape(num_targets, num_bins)
+    bins_acc = np.divide(bins_correct, bins_sizes, out=np.zeros(bins_sizes.shape), where=bins_correct > 0)
+
+    return bins_acc, bins_sizes
+
+
 def evaluate_bounds(
     estimated_bounds: Dict[str, pd.DataFrame],
     bin_predictions: Dict[str, pd.DataFrame],
@@ -28,6 +207,7 @@ def evaluate_bounds(
     num_folds: int = 8,
     show_fig: bool = False,
     combine_middle_bins: bool = False,
+    num_jobs: Optional[int] = None,
 ) -> Dict:
     """
     Evaluates error bounds for given uncertainty pairs and estimated bounds.
@@ -41,6 +221,8 @@ def evaluate_bounds(
         num_folds (int, optional): Number of folds for cross-validation. Defaults to 8.
         show_fig (bool, optional): Flag to show the figure. Defaults to False.
         combine_middle_bins (bool, optional): Flag to combine the middle bins. Defaults to False.
+        num_jobs (int, optional): Number of jobs to evaluate the folds in parallel using joblib.Parallel. Defaults to
+            None, i.e. the folds are evaluated sequentially.
 
     Returns:
         Dict: Dictionary containing evaluation results.
@@ -49,83 +231,79 @@ def evaluate_bounds(
     if combine_middle_bins:
         num_bins = 3
 
+    num_targets = len(targets)
+
     # Initialize results dicts
     all_bound_percents = {}
     all_bound_percents_notargetsep = {}
 
-    all_concat_errorbound_bins_target_sep_foldwise = [{} for x in range(len(targets))]  # type: List[Dict]
-    all_concat_errorbound_bins_target_sep_all = [{} for x in range(len(targets))]  # type: List[Dict]
+    all_concat_errorbound_bins_target_sep_foldwise = [{} for x in range(num_targets)]  # type: List[Dict]
+    all_concat_errorbound_bins_target_sep_all = [{} for x in range(num_targets)]  # type: List[Dict]
 
     # Loop over combinations of models (model) and uncertainty types (uncert_pair)
     for i, (model, data_structs) in enumerate(bin_predictions.items()):
-        error_bounds = estimated_bounds[model + " Error Bounds"]
+        fold_frames = _split_folds(data_structs, num_folds, uncertainty_pairs)
+        # Group the estimated bounds by fold once per model, rather than filtering them for every fold
+        bounds_by_fold = dict(iter(estimated_bounds[model + " Error Bounds"].groupby("fold")))
 
         for uncert_pair in uncertainty_pairs:
             uncertainty_type = uncert_pair[0]
+            error_col = uncertainty_type + " Error"
+            bins_col = uncertainty_type + " Uncertainty bins"
+            bounds_col = uncertainty_type + " Uncertainty bounds"
+            results_key = model + " " + uncertainty_type
 
             fold_learned_bounds_mean_targets = []
             fold_learned_bounds_mean_bins = [[] for x in range(num_bins)]  # type: List[List]
             fold_learned_bounds_bins_targetsnotsep = [[] for x in range(num_bins)]  # type: List[List]
             fold_all_bins_concat_targets_sep_foldwise = [
-                [[] for y in range(num_bins)] for x in range(len(targets))
+                [[] for y in range(num_bins)] for x in range(num_targets)
             ]  # type: List[List]
             fold_all_bins_concat_targets_sep_all = [
-                [[] for y in range(num_bins)] for x in range(len(targets))
+                [[] for y in range(num_bins)] for x in range(num_targets)
             ]  # type: List[List]
 
-            for fold in range(num_folds):
-                # Get the ids for this fold
-                fold_errors = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Error"]
-                ]
-                fold_bins = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Uncertainty bins"]
-                ]
-                fold_bounds = strip_for_bound(
-                    error_bounds[error_bounds["fold"] == fold][uncertainty_type + " Uncertainty bounds"].values
-                )
+            fold_bounds = [
+                strip_for_bound(bounds_by_fold[fold][bounds_col].values) if fold in bounds_by_fold else []
+                for fold in range(num_folds)
+            ]
 
-                return_dict = bin_wise_bound_eval(
-                    fold_bounds,
-                    fold_errors,
-                    fold_bins,
+            # Evaluate each fold independently, then accumulate the results in fold order
+            fold_results = Parallel(num_jobs)(
+                delayed(bin_wise_bound_eval)(
+                    fold_bounds[fold],
+                    *_extract_fold_data(fold_data, error_col, bins_col),
                     targets,
                     uncertainty_type,
                     num_bins=num_bins,
                     show_fig=show_fig,
                 )
+                for fold, fold_data in enumerate(fold_frames)
+            )
+
+            for return_dict in fold_results:
                 fold_learned_bounds_mean_targets.append(return_dict["mean all targets"])
 
-                for idx_bin in range(len(return_dict["mean all bins"])):
-                    fold_learned_bounds_mean_bins[idx_bin].append(return_dict["mean all bins"][idx_bin])
-                    fold_learned_bounds_bins_targetsnotsep[idx_bin] = (
-                        fold_learned_bounds_bins_targetsnotsep[idx_bin] + return_dict["mean all"][idx_bin]
-                    )
-
-                    for target_idx in range(len(targets)):
-                        fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin] = (
-                            fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin]
-                            + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin]
-                        )
-                        combined = (
-                            fold_all_bins_concat_targets_sep_all[target_idx][idx_bin]
-                            + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin]
-                        )
-
-                        fold_all_bins_concat_targets_sep_all[target_idx][idx_bin] = combined
-
-            # Reverses order so they are worst to best i.e. B5 -> B1
-            all_bound_percents[model + " " + uncertainty_type] = fold_learned_bounds_mean_bins[::-1]
-            all_bound_percents_notargetsep[model + " " + uncertainty_type] = fold_learned_bounds_bins_targetsnotsep[
-                ::-1
-            ]
+                _append_per_bin(fold_learned_bounds_mean_bins, return_dict["mean all bins"])
+                _extend_per_bin(fold_learned_bounds_bins_targetsnotsep, return_dict["mean all"])
+                _accumulate_targets_sep(
+                    return_dict["all bins concatenated targets seperated"],
+                    fold_all_bins_concat_targets_sep_foldwise,
+                    fold_all_bins_concat_targets_sep_all,
+                )
 
-            for target_idx in range(len(all_concat_errorbound_bins_target_sep_foldwise)):
+            # Reverses order (in place) so they are worst to best i.e. B5 -> B1
+            fold_learned_bounds_mean_bins.reverse()
+            fold_learned_bounds_bins_targetsnotsep.reverse()
+            all_bound_percents[results_key] = fold_learned_bounds_mean_bins
+            all_bound_percents_notargetsep[results_key] = fold_learned_bounds_bins_targetsnotsep
+
+            for target_idx in range(num_targets):
                 all_concat_errorbound_bins_target_sep_foldwise[target_idx][
-                    model + " " + uncertainty_type
+                    results_key
                 ] = fold_all_bins_concat_targets_sep_foldwise[target_idx]
                 all_concat_errorbound_bins_target_sep_all[target_idx][
-                    model + " " + uncertainty_type
+                    results_key
                 ] = fold_all_bins_concat_targets_sep_all[target_idx]
 
     return {
@@ -169,123 +347,31 @@ def bin_wise_bound_eval(
     Example:
         >>> bin_wise_bound_eval(fold_bounds_all_targets, fold_errors, fold_bins, [0,1], 'S-MHA', num_bins=5)
     """
-    all_target_perc = []
-    all_qs_perc: List[List[float]] = [[] for x in range(num_bins)]  #
-    all_qs_size: List[List[float]] = [[] for x in range(num_bins)]
-
-    all_qs_errorbound_concat_targets_sep: List[List[List[float]]] = [
-        [[] for y in range(num_bins)] for x in range(len(targets))
-    ]
-
-    for i_ti, target_idx in enumerate(targets):
-        true_errors_ti = fold_errors[(fold_errors["target_idx"] == target_idx)][["uid", uncertainty_type + " Error"]]
-        pred_bins_ti = fold_bins[(fold_errors["target_idx"] == target_idx)][
-            ["uid", uncertainty_type + " Uncertainty bins"]
-        ]
-
-        # Zip to dictionary
-        true_errors_ti = dict(zip(true_errors_ti.uid, true_errors_ti[uncertainty_type + " Error"]))
-        pred_bins_ti = dict(zip(pred_bins_ti.uid, pred_bins_ti[uncertainty_type + " Uncertainty bins"]))
-
-        # The error bounds are from B1 -> B5 i.e. best quantile of predictions to worst quantile of predictions
-        fold_bounds = fold_bounds_all_targets[i_ti]
-
-        # For each bin, see what % of targets are between the error bounds.
-        # If bin=0 then lower bound = 0, if bin=Q then no upper bound
-        # Keep track of #samples in each bin for weighted mean.
-
-        # turn dictionary of predicted bins into [[num_bins]] array
-        pred_bins_keys = []
-        pred_bins_errors = []
-        for i in range(num_bins):
-            inner_list_bin = list([key for key, val in pred_bins_ti.items() if str(i) == str(val)])
-            inner_list_errors = []
-
-            for id_ in inner_list_bin:
-                inner_list_errors.append(list([val for key, val in true_errors_ti.items() if str(key) == str(id_)])[0])
+    error_col = uncertainty_type + " Error"
+    bins_col = uncertainty_type + " Uncertainty bins"
 
-            pred_bins_errors.append(inner_list_errors)
-            pred_bins_keys.append(inner_list_bin)
+    target_arrays = _split_target_arrays(fold_errors, fold_bins, error_col, bins_col, targets)
 
-        bins_acc = []
-        bins_sizes = []
-        for q in range((num_bins)):
-            inner_bin_correct = 0
+    # For each target and bin, see what % of targets are between the error bounds.
+    # The error bounds are from B1 -> B5 i.e. best quantile of predictions to worst quantile of predictions.
+    # Keep track of #samples in each bin for weighted mean. Both are (num_targets, num_bins) arrays.
+    bins_acc, bins_sizes = _bound_accuracy(target_arrays, fold_bounds_all_targets, num_bins)
 
-            inbin_errors = pred_bins_errors[q]
+    # Weighted average over all bins, for each target
+    all_target_perc = np.average(bins_acc, axis=1, weights=bins_sizes)
 
-            for error in inbin_errors:
-                if q == 0:
-                    lower = 0
-                    upper = fold_bounds[q]
-
-                    if error <= upper and error > lower:
-                        inner_bin_correct += 1
-
-                elif q < (num_bins) - 1:
-                    lower = fold_bounds[q - 1]
-                    upper = fold_bounds[q]
-
-                    if error <= upper and error > lower:
-                        inner_bin_correct += 1
-
-                else:
-                    lower = fold_bounds[q - 1]
-                    upper = 999999999999999999999999999999
-
-                    if error > lower:
-                        inner_bin_correct += 1
-
-            if inner_bin_correct == 0:
-                accuracy_bin = 0.0
-            elif len(inbin_errors) == 0:
-                accuracy_bin = 1.0
-            else:
-                accuracy_bin = inner_bin_correct / len(inbin_errors)
-            bins_sizes.append(len(inbin_errors))
-            bins_acc.append(accuracy_bin)
-
-            all_qs_perc[q].append(accuracy_bin)
-            all_qs_size[q].append(len(inbin_errors))
-            all_qs_errorbound_concat_targets_sep[i_ti][q].append(accuracy_bin)
-
-        # Weighted average over all bins
-        weighted_mean_ti = 0.0
-        total_weights = 0.0
-        for l_idx in range(len(bins_sizes)):
-            bin_acc = bins_acc[l_idx]
-            bin_size = bins_sizes[l_idx]
-            weighted_mean_ti += bin_acc * bin_size
-            total_weights += bin_size
-        weighted_ave = weighted_mean_ti / total_weights
-        all_target_perc.append(weighted_ave)
-
-    # Weighted average for each of the quantile bins.
-    weighted_ave_binwise = []
-    for binidx in range(len(all_qs_perc)):
-        bin_accs = all_qs_perc[binidx]
-        bin_asizes = all_qs_size[binidx]
-
-        weighted_mean_bin = 0.0
-        total_weights_bin = 0.0
-        for l_idx in range(len(bin_accs)):
-            b_acc = bin_accs[l_idx]
-            b_siz = bin_asizes[l_idx]
-            weighted_mean_bin += b_acc * b_siz
-            total_weights_bin += b_siz
-
-        # Avoid div by 0
-        if weighted_mean_bin == 0 or total_weights_bin == 0:
-            weighted_ave_bin = 0.0
-        else:
-            weighted_ave_bin = weighted_mean_bin / total_weights_bin
-        weighted_ave_binwise.append(weighted_ave_bin)
+    # Weighted average for each of the quantile bins. Avoid div by 0.
+    bin_total_sizes = bins_sizes.sum(axis=0)
+    weighted_ave_binwise = np.divide(
+        (bins_acc * bins_sizes).sum(axis=0),
+        bin_total_sizes,
+        out=np.zeros(num_bins),
+        where=bin_total_sizes > 0,
+    ).tolist()
 
-    # No weighted average, just normal average
-    normal_ave_bin_wise = []
-    for binidx in range(len(all_qs_perc)):
-        bin_accs = all_qs_perc[binidx]
-        normal_ave_bin_wise.append(np.mean(bin_accs))
+    # Per-bin lists of the targets' accuracies, and per-target lists of each bin's (single) accuracy
+    all_qs_perc = bins_acc.T.tolist()
+    all_qs_errorbound_concat_targets_sep = bins_acc[:, :, np.newaxis].tolist()
 
     return {
         "mean all targets": np.mean(all_target_perc),
@@ -303,6 +389,7 @@ def get_mean_errors(
     num_folds: int = 8,
     error_scaling_factor: float = 1.0,
     combine_middle_bins: bool = False,
+    num_jobs: Optional[int] = None,
 ) -> Dict:
     """
     Evaluate uncertainty estimation's mean error of each bin.
@@ -319,6 +406,8 @@ def get_mean_errors(
         num_folds (int, optional): Number of folds. Defaults to 8.
         error_scaling_factor (int, optional): Scale error factor. Defaults to 1.
         combine_middle_bins (bool, optional): Combine middle bins if True. Defaults to False.
+        num_jobs (int, optional): Number of jobs to evaluate the folds in parallel using joblib.Parallel. Defaults to
+            None, i.e. the folds are evaluated sequentially.
 
     Returns:
         Dict[str, Union[Dict[str, List[List[float]]], List[Dict[str, List[float]]]]]: Dictionary with mean error for all
@@ -335,98 +424,89 @@ def get_mean_errors(
     if combine_middle_bins:
         num_bins = 3
 
+    num_targets = len(targets)
+
     # initialize empty dicts
     all_mean_error_bins = {}
     all_mean_error_bins_targets_sep = {}
-    all_concat_error_bins_target_sep_foldwise: List[Dict] = [{} for x in range(len(targets))]
-    all_concat_error_bins_target_sep_all: List[Dict] = [{} for x in range(len(targets))]
+    all_concat_error_bins_target_sep_foldwise: List[Dict] = [{} for x in range(num_targets)]
+    all_concat_error_bins_target_sep_all: List[Dict] = [{} for x in range(num_targets)]
 
     all_concat_error_bins_target_nosep = {}
     # Loop over models (model) and uncertainty methods (uncert_pair)
     for i, (model, data_structs) in enumerate(bin_predictions.items()):
+        fold_frames = _split_folds(data_structs, num_folds, uncertainty_pairs)
         for uncert_pair in uncertainty_pairs:  # uncert_pair = [pair name, error name , uncertainty name]
             uncertainty_type = uncert_pair[0]
+            error_col = uncertainty_type + " Error"
+            bins_col = uncertainty_type + " Uncertainty bins"
+            results_key = model + " " + uncertainty_type
 
             # Initialize lists to store fold-wise results
             fold_mean_targets = []
             fold_mean_bins: List[List[float]] = [[] for x in range(num_bins)]
             fold_all_bins: List[List[float]] = [[] for x in range(num_bins)]
             fold_all_bins_concat_targets_sep_foldwise: List[List[List[float]]] = [
-                [[] for y in range(num_bins)] for x in range(len(targets))
+                [[] for y in range(num_bins)] for x in range(num_targets)
             ]
             fold_all_bins_concat_targets_sep_all: List[List[List[float]]] = [
-                [[] for y in range(num_bins)] for x in range(len(targets))
+                [[] for y in range(num_bins)] for x in range(num_targets)
             ]
 
             fold_all_bins_concat_targets_nosep: List[List[float]] = [[] for x in range(num_bins)]
 
-            for fold in range(num_folds):
-                # Get the errors and predicted bins for this fold
-                fold_errors = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Error"]
-                ]
-                fold_bins = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Uncertainty bins"]
-                ]
-
-                return_dict = bin_wise_errors(
-                    fold_errors,
-                    fold_bins,
+            # Evaluate each fold independently, then accumulate the results in fold order
+            fold_results = Parallel(num_jobs)(
+                delayed(bin_wise_errors)(
+                    *_extract_fold_data(fold_data, error_col, bins_col),
                     num_bins,
                     targets,
                     uncertainty_type,
                     error_scaling_factor=error_scaling_factor,
                 )
-                fold_mean_targets.append(return_dict["mean all targets"])
-
-                for idx_bin in range(len(return_dict["mean all bins"])):
-                    fold_mean_bins[idx_bin].append(return_dict["mean all bins"][idx_bin])
-                    fold_all_bins[idx_bin] = fold_all_bins[idx_bin] + return_dict["all bins"][idx_bin]
-
-                    concat_no_sep = [x[idx_bin] for x in return_dict["all bins concatenated targets seperated"]]
-
-                    flattened_concat_no_sep = [x for sublist in concat_no_sep for x in sublist]
-                    flattened_concat_no_sep = [x for sublist in flattened_concat_no_sep for x in sublist]
-
-                    fold_all_bins_concat_targets_nosep[idx_bin] = (
-                        fold_all_bins_concat_targets_nosep[idx_bin] + flattened_concat_no_sep
-                    )
+                for fold_data in fold_frames
+            )
 
-                    for target_idx in range(len(targets)):
-                        fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin] = (
-                            fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin]
-                            + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin]
-                        )
+            for return_dict in fold_results:
+                fold_mean_targets.append(return_dict["mean all targets"])
 
-                        if return_dict["all bins concatenated targets seperated"][target_idx][idx_bin] != []:
-                            combined = (
-                                fold_all_bins_concat_targets_sep_all[target_idx][idx_bin]
-                                + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin][0]
-                            )
-                        else:
-                            combined = fold_all_bins_concat_targets_sep_all[target_idx][idx_bin]
+                _append_per_bin(fold_mean_bins, return_dict["mean all bins"])
+                _extend_per_bin(fold_all_bins, return_dict["all bins"])
 
-                        fold_all_bins_concat_targets_sep_all[target_idx][idx_bin] = combined
+                # Flatten each bin's errors over targets (and their nested per-target lists)
+                _extend_per_bin(
+                    fold_all_bins_concat_targets_nosep,
+                    (
+                        chain.from_iterable(chain.from_iterable(bin_results))
+                        for bin_results in zip(*return_dict["all bins concatenated targets seperated"])
+                    ),
+                )
+                _accumulate_targets_sep(
+                    return_dict["all bins concatenated targets seperated"],
+                    fold_all_bins_concat_targets_sep_foldwise,
+                    fold_all_bins_concat_targets_sep_all,
+                    unwrap_all=True,
+                )
 
-            # reverse orderings
-            fold_mean_bins = fold_mean_bins[::-1]
-            fold_all_bins = fold_all_bins[::-1]
-            fold_all_bins_concat_targets_nosep = fold_all_bins_concat_targets_nosep[::-1]
-            fold_all_bins_concat_targets_sep_foldwise = [x[::-1] for x in fold_all_bins_concat_targets_sep_foldwise]
-            fold_all_bins_concat_targets_sep_all = [x[::-1] for x in fold_all_bins_concat_targets_sep_all]
+            # reverse orderings in place
+            fold_mean_bins.reverse()
+            fold_all_bins.reverse()
+            fold_all_bins_concat_targets_nosep.reverse()
+            for target_bins in chain(fold_all_bins_concat_targets_sep_foldwise, fold_all_bins_concat_targets_sep_all):
+                target_bins.reverse()
 
-            all_mean_error_bins[model + " " + uncertainty_type] = fold_mean_bins
-            all_mean_error_bins_targets_sep[model + " " + uncertainty_type] = fold_all_bins
+            all_mean_error_bins[results_key] = fold_mean_bins
+            all_mean_error_bins_targets_sep[results_key] = fold_all_bins
 
-            all_concat_error_bins_target_nosep[model + " " + uncertainty_type] = fold_all_bins_concat_targets_nosep
+            all_concat_error_bins_target_nosep[results_key] = fold_all_bins_concat_targets_nosep
 
-            for target_idx in range(len(fold_all_bins_concat_targets_sep_foldwise)):
+            for target_idx in range(num_targets):
                 all_concat_error_bins_target_sep_foldwise[target_idx][
-                    model + " " + uncertainty_type
+                    results_key
                 ] = fold_all_bins_concat_targets_sep_foldwise[target_idx]
-                all_concat_error_bins_target_sep_all[target_idx][
-                    model + " " + uncertainty_type
-                ] = fold_all_bins_concat_targets_sep_all[target_idx]
+                all_concat_error_bins_target_sep_all[target_idx][results_key] = fold_all_bins_concat_targets_sep_all[
+                    target_idx
+                ]
 
     return {
         "all mean error bins nosep": all_mean_error_bins,
@@ -437,7 +517,9 @@ def get_mean_errors(
     }
 
 
-def evaluate_jaccard(bin_predictions, uncertainty_pairs, num_bins, targets, num_folds=8, combine_middle_bins=False):
+def evaluate_jaccard(
+    bin_predictions, uncertainty_pairs, num_bins, targets, num_folds=8, combine_middle_bins=False, num_jobs=None
+):
     """
         Evaluate uncertainty estimation's ability to predict true error quantiles.
         For each bin, we calculate the jaccard index (JI) between the pred bins and GT error quantiles.
@@ -450,7 +532,8 @@ def evaluate_jaccard(bin_predictions, uncertainty_pairs, num_bins, targets, num_
         num_bins (int): Number of quantile bins,
         targets (list) list of targets to measure uncertainty estimation,
         num_folds (int): Number of folds,
-
+        combine_middle_bins (bool): Combine middle bins if True,
+        num_jobs (int): Number of jobs to evaluate the folds in parallel using joblib.Parallel, None runs sequentially.
 
     Returns:
         [Dict]: Dicts with JI for all targets combined and targets seperated.
@@ -465,6 +548,8 @@ def evaluate_jaccard(bin_predictions, uncertainty_pairs, num_bins, targets, num_
         num_bins = 3
     else:
         num_bins_for_quantiles = num_bins
+    num_targets = len(targets)
+
     # initialize empty dicts
     all_jaccard_data = {}
     all_jaccard_bins_targets_sep = {}
@@ -475,12 +560,16 @@ def evaluate_jaccard(bin_predictions, uncertainty_pairs, num_bins, targets, num_
     all_precision_data = {}
     all_precision__bins_targets_sep = {}
 
-    all_concat_jacc_bins_target_sep_foldwise = [{} for x in range(len(targets))]
-    all_concat_jacc_bins_target_sep_all = [{} for x in range(len(targets))]
+    all_concat_jacc_bins_target_sep_foldwise = [{} for x in range(num_targets)]
+    all_concat_jacc_bins_target_sep_all = [{} for x in range(num_targets)]
     # Loop over models (model) and uncertainty methods (uncert_pair)
     for i, (model, data_structs) in enumerate(bin_predictions.items()):
+        fold_frames = _split_folds(data_structs, num_folds, uncertainty_pairs)
         for uncert_pair in uncertainty_pairs:  # uncert_pair = [pair name, error name , uncertainty name]
             uncertainty_type = uncert_pair[0]
+            error_col = uncertainty_type + " Error"
+            bins_col = uncertainty_type + " Uncertainty bins"
+            results_key = model + " " + uncertainty_type
 
             fold_mean_targets = []
             fold_mean_bins = [[] for x in range(num_bins)]
@@ -494,75 +583,59 @@ def evaluate_jaccard(bin_predictions, uncertainty_pairs, num_bins, targets, num_
             fold_mean_bins_precision = [[] for x in range(num_bins)]
             fold_all_bins_precision = [[] for x in range(num_bins)]
 
-            fold_all_bins_concat_targets_sep_foldwise = [[[] for y in range(num_bins)] for x in range(len(targets))]
-            fold_all_bins_concat_targets_sep_all = [[[] for y in range(num_bins)] for x in range(len(targets))]
+            fold_all_bins_concat_targets_sep_foldwise = [[[] for y in range(num_bins)] for x in range(num_targets)]
+            fold_all_bins_concat_targets_sep_all = [[[] for y in range(num_bins)] for x in range(num_targets)]
 
-            for fold in range(num_folds):
-                # Get the errors and predicted bins for this fold
-                fold_errors = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Error"]
-                ]
-                fold_bins = data_structs[(data_structs["Testing Fold"] == fold)][
-                    ["uid", "target_idx", uncertainty_type + " Uncertainty bins"]
-                ]
-
-                return_dict = bin_wise_jaccard(
-                    fold_errors,
-                    fold_bins,
+            # Evaluate each fold independently, then accumulate the results in fold order
+            fold_results = Parallel(num_jobs)(
+                delayed(bin_wise_jaccard)(
+                    *_extract_fold_data(fold_data, error_col, bins_col),
                     num_bins,
                     num_bins_for_quantiles,
                     targets,
                     uncertainty_type,
                     combine_middle_bins,
                 )
+                for fold_data in fold_frames
+            )
 
+            for return_dict in fold_results:
                 fold_mean_targets.append(return_dict["mean all targets"])
                 fold_mean_targets_recall.append(return_dict["mean all targets recall"])
                 fold_mean_targets_precision.append(return_dict["mean all targets precision"])
 
-                for idx_bin in range(len(return_dict["mean all bins"])):
-                    fold_mean_bins[idx_bin].append(return_dict["mean all bins"][idx_bin])
-                    fold_all_bins[idx_bin] = fold_all_bins[idx_bin] + return_dict["all bins"][idx_bin]
-
-                    fold_mean_bins_recall[idx_bin].append(return_dict["mean all bins recall"][idx_bin])
-                    fold_all_bins_recall[idx_bin] = (
-                        fold_all_bins_recall[idx_bin] + return_dict["all bins recall"][idx_bin]
-                    )
+                _append_per_bin(fold_mean_bins, return_dict["mean all bins"])
+                _extend_per_bin(fold_all_bins, return_dict["all bins"])
 
-                    fold_mean_bins_precision[idx_bin].append(return_dict["mean all bins precision"][idx_bin])
-                    fold_all_bins_precision[idx_bin] = (
-                        fold_all_bins_precision[idx_bin] + return_dict["all bins precision"][idx_bin]
-                    )
+                _append_per_bin(fold_mean_bins_recall, return_dict["mean all bins recall"])
+                _extend_per_bin(fold_all_bins_recall, return_dict["all bins recall"])
 
-                    # Get the jaccard saved for the individual targets, flattening the folds and also not flattening the folds
-                    for target_idx in range(len(targets)):
-                        fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin] = (
-                            fold_all_bins_concat_targets_sep_foldwise[target_idx][idx_bin]
-                            + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin]
-                        )
-                        combined = (
-                            fold_all_bins_concat_targets_sep_all[target_idx][idx_bin]
-                            + return_dict["all bins concatenated targets seperated"][target_idx][idx_bin]
-                        )
+                _append_per_bin(fold_mean_bins_precision, return_dict["mean all bins precision"])
+                _extend_per_bin(fold_all_bins_precision, return_dict["all bins precision"])
 
-                        fold_all_bins_concat_targets_sep_all[target_idx][idx_bin] = combined
+                # Get the jaccard saved for the individual targets, flattening the folds and also not flattening the folds
+                _accumulate_targets_sep(
+                    return_dict["all bins concatenated targets seperated"],
+                    fold_all_bins_concat_targets_sep_foldwise,
+                    fold_all_bins_concat_targets_sep_all,
+                )
 
-            all_jaccard_data[model + " " + uncertainty_type] = fold_mean_bins
-            all_jaccard_bins_targets_sep[model + " " + uncertainty_type] = fold_all_bins
+            all_jaccard_data[results_key] = fold_mean_bins
+            all_jaccard_bins_targets_sep[results_key] = fold_all_bins
 
-            all_recall_data[model + " " + uncertainty_type] = fold_mean_bins_recall
-            all_recall_bins_targets_sep[model + " " + uncertainty_type] = fold_all_bins_recall
+            all_recall_data[results_key] = fold_mean_bins_recall
+            all_recall_bins_targets_sep[results_key] = fold_all_bins_recall
 
-            all_precision_data[model + " " + uncertainty_type] = fold_mean_bins_precision
-            all_precision__bins_targets_sep[model + " " + uncertainty_type] = fold_all_bins_precision
+            all_precision_data[results_key] = fold_mean_bins_precision
+            all_precision__bins_targets_sep[results_key] = fold_all_bins_precision
 
-            for target_idx in range(len(all_concat_jacc_bins_target_sep_foldwise)):
+            for target_idx in range(num_targets):
                 all_concat_jacc_bins_target_sep_foldwise[target_idx][
-                    model + " " + uncertainty_type
+                    results_key
                 ] = fold_all_bins_concat_targets_sep_foldwise[target_idx]
-                all_concat_jacc_bins_target_sep_all[target_idx][
-                    model + " " + uncertainty_type
-                ] = fold_all_bins_concat_targets_sep_all[target_idx]
+                all_concat_jacc_bins_target_sep_all[target_idx][results_key] = fold_all_bins_concat_targets_sep_all[
+                    target_idx
+                ]
 
     return {
         "Jaccard All": all_jaccard_data,
@@ -592,49 +665,39 @@ def bin_wise_errors(fold_errors, fold_bins, num_bins, targets, uncertainty_key,
         [Dict]: Dict with mean error statistics.
     """
 
+    num_targets = len(targets)
+    error_col = uncertainty_key + " Error"
+    bins_col = uncertainty_key + " Uncertainty bins"
     all_target_error = []
     all_qs_error = [[] for x in range(num_bins)]
-    all_qs_error_concat_targets_sep = [[[] for y in range(num_bins)] for x in range(len(targets))]
-
-    for i, target_idx in enumerate(targets):
-        true_errors_ti = fold_errors[(fold_errors["target_idx"] == target_idx)][["uid", uncertainty_key + " Error"]]
-        pred_bins_ti = fold_bins[(fold_errors["target_idx"] == target_idx)][
-            ["uid", uncertainty_key + " Uncertainty bins"]
-        ]
+    all_qs_error_concat_targets_sep = [[[] for y in range(num_bins)] for x in range(num_targets)]
 
-        # Zip to dictionary
-        true_errors_ti = dict(
-            zip(true_errors_ti.uid, true_errors_ti[uncertainty_key + " Error"] * error_scaling_factor)
-        )
-        pred_bins_ti = dict(zip(pred_bins_ti.uid, pred_bins_ti[uncertainty_key + " Uncertainty bins"]))
+    target_arrays = _split_target_arrays(fold_errors, fold_bins, error_col, bins_col, targets)
 
-        pred_bins_keys = []
-        pred_bins_errors = []
+    for i, (errors_ti, bins_ti) in enumerate(target_arrays):
+        # Samples predicted outside of the bins are ignored
+        in_bins = (bins_ti >= 0) & (bins_ti < num_bins)
+        bin_ids = bins_ti[in_bins]
+        errors_ti = errors_ti[in_bins] * error_scaling_factor
 
-        # This is saving them from best quantile of predictions to worst quantile of predictions in terms of uncertainty
-        for j in range(num_bins):
-            inner_list = list([key for key, val in pred_bins_ti.items() if str(j) == str(val)])
-            inner_list_errors = []
+        # Per-bin error sums and sample counts in a single pass, from best quantile of predictions to worst quantile
+        # of predictions in terms of uncertainty
+        bin_counts = np.bincount(bin_ids, minlength=num_bins)
+        bin_means = np.bincount(bin_ids, weights=errors_ti, minlength=num_bins) / np.maximum(bin_counts, 1)
 
-            for id_ in inner_list:
-                inner_list_errors.append(list([val for key, val in true_errors_ti.items() if str(key) == str(id_)])[0])
-
-            pred_bins_errors.append(inner_list_errors)
-            pred_bins_keys.append(inner_list)
+        # Group the errors by bin (stable, so each bin keeps the sample order)
+        pred_bins_errors = np.split(errors_ti[np.argsort(bin_ids, kind="stable")], np.cumsum(bin_counts)[:-1])
 
         # Now for each bin, get the mean error
         inner_errors = []
         for bin in range(num_bins):
-            # pred_b_keys = pred_bins_keys[bin]
-            pred_b_errors = pred_bins_errors[bin]
-
             # test for empty bin, it would've created a mean_error==nan , so don't add it!
-            if pred_b_errors == []:
+            if not bin_counts[bin]:
                 continue
 
-            mean_error = np.mean(pred_b_errors)
+            mean_error = bin_means[bin]
             all_qs_error[bin].append(mean_error)
-            all_qs_error_concat_targets_sep[i][bin].append(pred_b_errors)
+            all_qs_error_concat_targets_sep[i][bin].append(pred_bins_errors[bin].tolist())
             inner_errors.append(mean_error)
 
         all_target_error.append(np.mean(inner_errors))
@@ -642,7 +705,7 @@ def bin_wise_errors(fold_errors, fold_bins, num_bins, targets, uncertainty_key,
     mean_all_targets = np.mean(all_target_error)
     mean_all_bins = []
     for x in all_qs_error:
-        if x == []:
+        if not x:
             mean_all_bins.append(None)
         else:
             mean_all_bins.append(np.mean(x))
@@ -689,139 +752,77 @@ def bin_wise_jaccard(
         >>> bin_wise_jaccard(fold_errors, fold_bins, 10, 5, [0,1], 'S-MHA', True)
     """
 
-    all_target_jacc: List[float] = []
-    all_qs_jacc: List[List[float]] = [[] for x in range(num_bins)]
+    num_targets = len(targets)
+    error_col = uncertainty_key + " Error"
+    bins_col = uncertainty_key + " Uncertainty bins"
+    # Every target gets exactly one value per bin, so the per-bin results are (num_bins, num_targets) arrays
+    all_qs_jacc = np.zeros((num_bins, num_targets))
+    all_qs_recall = np.zeros((num_bins, num_targets))
+    all_qs_precision = np.zeros((num_bins, num_targets))
 
     all_qs_jacc_concat_targets_sep: List[List[List[float]]] = [
-        [[] for y in range(num_bins)] for x in range(len(targets))
+        [[] for y in range(num_bins)] for x in range(num_targets)
     ]
 
-    all_target_recall: List[float] = []
-    all_qs_recall: List[List[float]] = [[] for x in range(num_bins)]
-
-    all_target_precision: List[float] = []
-    all_qs_precision: List[List[float]] = [[] for x in range(num_bins)]
-
-    for i, target_idx in enumerate(targets):
-        true_errors_ti = fold_errors[(fold_errors["target_idx"] == target_idx)][["uid", uncertainty_key + " Error"]]
-        pred_bins_ti = fold_bins[(fold_errors["target_idx"] == target_idx)][
-            ["uid", uncertainty_key + " Uncertainty bins"]
-        ]
-
-        # Zip to dictionary
-        true_errors_ti = dict(zip(true_errors_ti.uid, true_errors_ti[uncertainty_key + " Error"]))
-        pred_bins_ti = dict(zip(pred_bins_ti.uid, pred_bins_ti[uncertainty_key + " Uncertainty bins"]))
-
-        pred_bins_keys = []
-        pred_bins_errors = []
-
-        # This is saving them from best quantile of predictions to worst quantile of predictions in terms of uncertainty
-        for j in range(num_bins):
-            inner_list = list([key for key, val in pred_bins_ti.items() if str(j) == str(val)])
-            inner_list_errors = []
+    # If we are combining the middle bins, map the true error quantiles to the combined bins with a lookup table,
+    # e.g. 5 quantiles -> [0, 1, 1, 1, 2].
+    if combine_middle_bins:
+        bin_remap = np.concatenate([[0], np.ones(num_bins_quantiles - 2, dtype=int), [2]])
+    else:
+        bin_remap = None
 
-            for id_ in inner_list:
-                inner_list_errors.append(list([val for key, val in true_errors_ti.items() if str(key) == str(id_)])[0])
+    quantiles = np.arange(1 / num_bins_quantiles, 1, 1 / num_bins_quantiles)[: num_bins_quantiles - 1]
 
-            pred_bins_errors.append(inner_list_errors)
-            pred_bins_keys.append(inner_list)
+    target_arrays = _split_target_arrays(fold_errors, fold_bins, error_col, bins_col, targets)
 
+    for i, (true_errors_ti, pred_bins) in enumerate(target_arrays):
         # Get the true error quantiles
-        sorted_errors = [v for k, v in sorted(true_errors_ti.items(), key=lambda item: item[1])]
-
-        quantiles = np.arange(1 / num_bins_quantiles, 1, 1 / num_bins_quantiles)[: num_bins_quantiles - 1]
-        quantile_thresholds = [np.quantile(sorted_errors, q) for q in quantiles]
+        quantile_thresholds = np.quantile(true_errors_ti, quantiles)
 
-        # If we are combining the middle bins, combine the middle lists into 1 list.
+        # Ground truth quantile group of each sample: group q holds the errors in (threshold q-1, threshold q],
+        # the first group has no lower bound and the last group has no upper bound.
+        gt_bins = np.digitize(true_errors_ti, quantile_thresholds, right=True)
 
-        if combine_middle_bins:
-            quantile_thresholds = [quantile_thresholds[0], quantile_thresholds[-1]]
+        if bin_remap is not None:
+            gt_bins = bin_remap[gt_bins]
 
-        errors_groups = []
-        key_groups = []
-
-        for q in range(len(quantile_thresholds) + 1):
-            inner_list_e = []
-            inner_list_id = []
-            for i_te, (id_, error) in enumerate(true_errors_ti.items()):
-                if q == 0:
-                    lower = 0
-                    upper = quantile_thresholds[q]
-
-                    if error <= upper:
-                        inner_list_e.append(error)
-                        inner_list_id.append(id_)
-
-                elif q < len(quantile_thresholds):
-                    lower = quantile_thresholds[q - 1]
-                    upper = quantile_thresholds[q]
-
-                    if error <= upper and error > lower:
-                        inner_list_e.append(error)
-                        inner_list_id.append(id_)
-
-                else:
-                    lower = quantile_thresholds[q - 1]
-                    upper = 999999999999999999999999999999
-
-                    if error > lower:
-                        inner_list_e.append(error)
-                        inner_list_id.append(id_)
-
-            errors_groups.append(inner_list_e)
-            key_groups.append(inner_list_id)
-
-        # flip them so they go from B5 to B1
-        pred_bins_keys = pred_bins_keys[::-1]
-        pred_bins_errors = pred_bins_errors[::-1]
-        errors_groups = errors_groups[::-1]
-        key_groups = key_groups[::-1]
+        # Set sizes of every bin in one histogram pass each: predicted, ground truth and their intersection
+        # (samples whose predicted bin matches their ground truth bin). The histograms are flipped (as array views)
+        # so they go from B5 to B1.
+        in_bins = (pred_bins >= 0) & (pred_bins < num_bins)
+        pred_sizes = np.bincount(pred_bins[in_bins], minlength=num_bins)[::-1].tolist()
+        gt_sizes = np.bincount(gt_bins, minlength=num_bins)[::-1].tolist()
+        both_sizes = np.bincount(pred_bins[in_bins & (pred_bins == gt_bins)], minlength=num_bins)[::-1].tolist()
 
         # Now for each bin, get the jaccard similarity
-        inner_jaccard_sims = []
-        inner_recalls = []
-        inner_precisions = []
-        for bin in range(num_bins):
-            pred_b_keys = pred_bins_keys[bin]
-            gt_bins_keys = key_groups[bin]
-
-            j_sim = jaccard_similarity(pred_b_keys, gt_bins_keys)
-            all_qs_jacc[bin].append(j_sim)
-            all_qs_jacc_concat_targets_sep[i][bin].append(j_sim)
-
-            inner_jaccard_sims.append(j_sim)
-
+        for bin, (num_pred, num_gt, num_both) in enumerate(zip(pred_sizes, gt_sizes, both_sizes)):
+            # Empty sets short-circuit to fixed values, without any division.
             # If quantile threshold is the same as the last quantile threshold,
             # the GT set is empty (rare, but can happen if distribution of errors is quite uniform).
-            if len(gt_bins_keys) == 0:
-                recall = 1.0
-                precision = 0.0
+            if num_gt == 0:
+                j_sim, recall, precision = 0, 1.0, 0.0
+            elif num_pred == 0:
+                j_sim, recall, precision = 0, 0.0, 0.0
             else:
-                recall = sum(el in gt_bins_keys for el in pred_b_keys) / len(gt_bins_keys)
-
-                if len(pred_b_keys) == 0 and len(gt_bins_keys) > 0:
-                    precision = 0.0
-                else:
-                    precision = sum(1 for x in pred_b_keys if x in gt_bins_keys) / len(pred_b_keys)
+                j_sim = num_both / (num_pred + num_gt - num_both)
+                recall = num_both / num_gt
+                precision = num_both / num_pred
 
-            inner_recalls.append(recall)
-            inner_precisions.append(precision)
-            all_qs_recall[bin].append(recall)
-            all_qs_precision[bin].append(precision)
-
-        all_target_jacc.append(np.mean(inner_jaccard_sims))
-        all_target_recall.append(np.mean(inner_recalls))
-        all_target_precision.append(np.mean(inner_precisions))
+            all_qs_jacc[bin, i] = j_sim
+            all_qs_recall[bin, i] = recall
+            all_qs_precision[bin, i] = precision
+            all_qs_jacc_concat_targets_sep[i][bin].append(j_sim)
 
+    # Means over all targets (per bin) and over all bins (per target, then averaged) as single reductions
     return {
-        "mean all targets": np.mean(all_target_jacc),
-        "mean all bins": [np.mean(x) for x in all_qs_jacc],
-        "all bins": all_qs_jacc,
-        "mean all targets recall": np.mean(all_target_recall),
-        "mean all bins recall": [np.mean(x) for x in all_qs_recall],
-        "all bins recall": all_qs_recall,
-        "mean all targets precision": np.mean(all_target_precision),
-        "mean all bins precision": [np.mean(x) for x in all_qs_precision],
-        "all bins precision": all_qs_precision,
+        "mean all targets": all_qs_jacc.mean(axis=0).mean(),
+        "mean all bins": all_qs_jacc.mean(axis=1).tolist(),
+        "all bins": all_qs_jacc.tolist(),
+        "mean all targets recall": all_qs_recall.mean(axis=0).mean(),
+        "mean all bins recall": all_qs_recall.mean(axis=1).tolist(),
+        "all bins recall": all_qs_recall.tolist(),
+        "mean all targets precision": all_qs_precision.mean(axis=0).mean(),
+        "mean all bins precision": all_qs_precision.mean(axis=1).tolist(),
+        "all bins precision": all_qs_precision.tolist(),
         "all bins concatenated targets seperated": all_qs_jacc_concat_targets_sep,
     }
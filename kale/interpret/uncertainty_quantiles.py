@@ -15,7 +15,7 @@ Functions related to interpreting the uncertainty quantiles from the quantile bi
 import logging
 import math
 import os
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import matplotlib.lines as mlines
 import matplotlib.patches as patches
@@ -24,9 +24,12 @@ import matplotlib.ticker as ticker
 import numpy as np
 import pandas as pd
 import pwlf
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import LineCollection
 from matplotlib.ticker import ScalarFormatter
 from scipy import stats
 from sklearn.isotonic import IsotonicRegression
+from sklearn.utils.parallel import delayed, Parallel
 
 from kale.evaluate.similarity_metrics import evaluate_correlations
 from kale.evaluate.uncertainty_metrics import evaluate_bounds, evaluate_jaccard, get_mean_errors
@@ -206,23 +209,31 @@ def quantile_binning_and_est_errors(
     if type not in valid_types:
         raise ValueError("results: type must be one of %r. " % valid_types)
 
+    # Convert once here, rather than letting sklearn and np.quantile each convert the lists again
+    errors_arr = np.asarray(errors, dtype=np.float64)
+    uncert_arr = np.asarray(uncertainties, dtype=np.float64)
+
     # Isotonically regress line
     ir = IsotonicRegression(out_of_bounds="clip", increasing=True)
 
-    _ = ir.fit_transform(uncertainties, errors)
+    ir.fit(uncert_arr, errors_arr)
 
     uncert_boundaries = []
     estimated_errors = []
 
-    # Estimate error bounds for each quantile bin
+    # Estimate error bounds for each quantile bin.
+    # All quantile boundaries come from a single sort, and their errors from a single isotonic prediction.
     if type == "quantile":
-        quantiles = np.arange(1 / num_bins, 1, 1 / num_bins)[: num_bins - 1]
-        for q in range(len(quantiles)):
-            q_conf_higher = [np.quantile(uncertainties, quantiles[q])]
-            q_error_higher = ir.predict(q_conf_higher)
+        quantiles = np.linspace(0.0, 1.0, num_bins + 1)[1:-1]
+        q_conf_higher = np.quantile(uncert_arr, quantiles)
+
+        # IF combine bins, we keep only the boundaries of the two outer bins
+        if combine_middle_bins:
+            q_conf_higher = q_conf_higher[[0, -1]]
+        q_error_higher = ir.predict(q_conf_higher)
 
-            estimated_errors.append(q_error_higher[0])
-            uncert_boundaries.append(q_conf_higher)
+        estimated_errors = q_error_higher.tolist()
+        uncert_boundaries = [[boundary] for boundary in q_conf_higher.tolist()]
 
     elif type == "error_wise":
         quantiles = np.arange(num_bins - 1)
@@ -231,14 +242,213 @@ def quantile_binning_and_est_errors(
         uncert_boundaries = [(ir.predict(x)).tolist() for x in estimated_errors]
         raise NotImplementedError("error_wise Quantile Binning not implemented yet")
 
-    # IF combine bins, we grab only the values for the two outer bins
-    if combine_middle_bins:
-        estimated_errors = [estimated_errors[0], estimated_errors[-1]]
-        uncert_boundaries = [uncert_boundaries[0], uncert_boundaries[-1]]
-
     return uncert_boundaries, estimated_errors
 
 
+def _build_dict_index(
+    target_uncert_dicts: Dict[str, Any], models: List[str], uncertainty_types_list: List[List[str]]
+) -> Dict[Tuple[str, str], str]:
+    """
+    Maps each (model, uncertainty type) pair to the key of its data in target_uncert_dicts, scanning the keys once.
+
+    A key belongs to a pair if it contains both the model name and the uncertainty type.
+
+    Args:
+        target_uncert_dicts (Dict[str, Any]): Dictionary of data, keyed by strings containing model and uncertainty
+            type.
+        models (List[str]): List of models.
+        uncertainty_types_list (List[List[str]]): List of lists whose first element is the uncertainty type.
+
+    Returns:
+        Dict[Tuple[str, str], str]: Dictionary mapping (model, uncertainty type) to the matching key.
+
+    Raises:
+        ValueError: If more than one key matches the same (model, uncertainty type) pair.
+    """
+    dict_index: Dict[Tuple[str, str], str] = {}
+    for key in target_uncert_dicts.keys():
+        for model_type in models:
+            if model_type not in key:
+                continue
+            for uncert_pair in uncertainty_types_list:
+                uncertainty_type = uncert_pair[0]
+                if uncertainty_type not in key:
+                    continue
+                if (model_type, uncertainty_type) in dict_index:
+                    raise ValueError(
+                        "Keys %r and %r both match model %r and uncertainty type %r."
+                        % (dict_index[(model_type, uncertainty_type)], key, model_type, uncertainty_type)
+                    )
+                dict_index[(model_type, uncertainty_type)] = key
+    return dict_index
+
+
+def _find_dict_key(target_uncert_dicts: Dict[str, Any], model_type: str, uncertainty_type: str) -> str:
+    """
+    Finds the key of the data for a model and uncertainty type in target_uncert_dicts.
+
+    The metric dictionaries are keyed "<model> <uncertainty type>", so that key is looked up directly. Otherwise the
+    first key containing both the model name and the uncertainty type is used.
+
+    Args:
+        target_uncert_dicts (Dict[str, Any]): Dictionary of data, keyed by strings containing model and uncertainty
+            type.
+        model_type (str): The model name.
+        uncertainty_type (str): The uncertainty type.
+
+    Returns:
+        str: The matching key.
+    """
+    exact_key = model_type + " " + uncertainty_type
+    if exact_key in target_uncert_dicts:
+        return exact_key
+    return next(x for x in target_uncert_dicts if (model_type in x) and (uncertainty_type in x))
+
+
+def _bin_values(bin_data: Sequence[Optional[float]], drop_missing: bool = True, scale: float = 1.0) -> np.ndarray:
+    """
+    Converts the values of a single bin to a float array for plotting.
+
+    Args:
+        bin_data (Sequence[Optional[float]]): Values of the bin, where None marks a missing value.
+        drop_missing (bool, optional): Whether to drop missing (None or NaN) values. Defaults to True.
+        scale (float, optional): Factor to multiply the values by, e.g. 100 to show percentages. Defaults to 1.0.
+
+    Returns:
+        np.ndarray: The bin values as a float array.
+    """
+    values = np.asarray(bin_data, dtype=np.float64)
+    if drop_missing:
+        values = values[~np.isnan(values)]
+    if scale != 1.0:
+        values = values * scale
+    return values
+
+
+def _split_bin_values(model_data: Sequence[Sequence[Optional[float]]], scale: float = 1.0) -> List[np.ndarray]:
+    """
+    Converts the values of all bins to float arrays for plotting, dropping missing values.
+
+    All bins are converted, masked and scaled together as one flat array, then split back into one view per bin.
+
+    Args:
+        model_data (Sequence[Sequence[Optional[float]]]): Values of each bin, where None marks a missing value.
+        scale (float, optional): Factor to multiply the values by, e.g. 100 to show percentages. Defaults to 1.0.
+
+    Returns:
+        List[np.ndarray]: The values of each bin as a float array, without missing values.
+    """
+    if not model_data:
+        return []
+    values = np.array([value for bin_data in model_data for value in bin_data], dtype=np.float64)
+    valid = ~np.isnan(values)
+    # Count the values kept before each bin boundary to find where every bin starts in the masked array
+    bounds = np.cumsum([len(bin_data) for bin_data in model_data])
+    valid_before = np.concatenate((np.zeros(1, dtype=np.intp), np.cumsum(valid)))
+    values = values[valid]
+    if scale != 1.0:
+        values *= scale
+    return np.split(values, valid_before[bounds[:-1]])
+
+
+def _mean_and_std(values: List[float]) -> Tuple[float, float]:
+    """
+    Computes the mean and population standard deviation of a short list with Python builtins.
+
+    For the handful of values per bin this avoids the fixed dispatch cost of np.mean and np.std.
+
+    Args:
+        values (List[float]): Non-empty list of values.
+
+    Returns:
+        Tuple[float, float]: The mean and standard deviation of the values.
+    """
+    mean = sum(values) / len(values)
+    std = math.sqrt(sum((value - mean) ** 2 for value in values) / len(values))
+    return mean, std
+
+
+def _max_top_cap_height(rects: List[Dict[str, Any]]) -> float:
+    """
+    Finds the height of the tallest top whisker cap over all drawn box plots, in a single vectorised pass.
+
+    Args:
+        rects (List[Dict[str, Any]]): The dictionaries of artists returned by ax.boxplot.
+
+    Returns:
+        float: The maximum top cap height, ignoring empty boxes, and at least 0.
+    """
+    # ax.boxplot adds the lower then the upper cap of each box, so the top caps are every second one.
+    top_caps = [cap.get_ydata() for rect in rects for cap in rect["caps"][1::2]]
+    if not top_caps:
+        return 0.0
+    top_caps = np.concatenate(top_caps)
+    return float(np.max(top_caps, initial=0.0, where=~np.isnan(top_caps)))
+
+
+def _draw_box_group(
+    ax,
+    datasets: List[np.ndarray],
+    positions: List[float],
+    width: float,
+    box_color: str,
+    hatch: Optional[str],
+    median_style: Dict[str, Any],
+    mean_style: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Draws a group of boxes sharing the same style with a single ax.boxplot call, then styles them.
+
+    Args:
+        ax: The matplotlib axes to draw on.
+        datasets (List[np.ndarray]): The data of each box.
+        positions (List[float]): The x-axis location of each box.
+        width (float): The width of the boxes.
+        box_color (str): The face color of the boxes.
+        hatch (Optional[str]): The hatch pattern of the boxes, or None for no hatch.
+        median_style (Dict[str, Any]): Properties for the median lines.
+        mean_style (Dict[str, Any]): Properties for the mean markers.
+
+    Returns:
+        Dict[str, Any]: The dictionary of artists returned by ax.boxplot.
+    """
+    rect = ax.boxplot(datasets, positions=positions, sym="", widths=width, showmeans=True, patch_artist=True)
+
+    # Set color, pattern, median line and mean marker.
+    for r in rect["boxes"]:
+        r.set(color="black", linewidth=1)
+        r.set(facecolor=box_color)
+
+        if hatch is not None:
+            r.set_hatch(hatch)
+
+    for median in rect["medians"]:
+        median.set(**median_style)
+
+    for mean in rect["means"]:
+        mean.set(**mean_style)
+
+    return rect
+
+
+def _draw_individual_dots(
+    ax, rng: np.random.Generator, datasets: List[np.ndarray], positions: List[float], dot_color: str
+) -> None:
+    """
+    Draws the individual data points of a group of boxes as one line of markers, with some random "jitter" on the
+    x-axis around each box.
+
+    Args:
+        ax: The matplotlib axes to draw on.
+        rng (np.random.Generator): Random generator for the jitter.
+        datasets (List[np.ndarray]): The data of each box.
+        positions (List[float]): The x-axis location of each box.
+        dot_color (str): The color of the dots.
+    """
+    x = rng.normal(np.repeat(positions, [len(data) for data in datasets]), 0.01)
+    ax.plot(x, np.concatenate(datasets), color=dot_color, marker=".", linestyle="None", alpha=0.75)
+
+
 def generic_box_plot_loop(
     cmaps: List[str],
     target_uncert_dicts: Dict[str, List[List[float]]],
@@ -312,7 +522,9 @@ def generic_box_plot_loop(
 
     plt.style.use("fivethirtyeight")
 
-    orders = []
+    # One generator per figure for the x-axis jitter of the individual dots
+    rng = np.random.default_rng()
+
     ax = plt.gca()
     ax.xaxis.grid(False)
 
@@ -323,125 +535,122 @@ def generic_box_plot_loop(
     inner_min_x_loc = 0.0
 
     circ_patches = []
-    max_bin_height = 0.0
+    all_sample_label_x_locs: List[Any] = []
+    all_sample_percs: List[Any] = []
+
+    # Style values shared by every box, looked up once rather than per box.
+    dot_color = cmaps[len(uncertainty_types_list)]
+    median_style = {"color": "crimson", "linewidth": 3}
+    mean_style = {"markerfacecolor": "crimson", "markeredgecolor": "black", "markersize": 10}
+
+    dict_index = _build_dict_index(target_uncert_dicts, models, uncertainty_types_list)
+
+    # Sample information mode, checked once rather than for every box
+    track_samples = show_sample_info != "None"
+    show_all_samples = show_sample_info == "All"
+    show_average_samples = show_sample_info == "Average"
+
+    # Draw every box with interactive mode off so interactive backends do not redraw after each one.
+    with plt.ioff():
+        for i, (uncert_pair) in enumerate(uncertainty_types_list):
+            uncertainty_type = (uncert_pair)[0]
+            box_color = cmaps[i]
+
+            # Get each model's data for this uncertainty type once, rather than looking it up for every bin
+            all_models_data = [target_uncert_dicts[dict_index[(model_type, uncertainty_type)]] for model_type in models]
+            if track_samples:
+                all_models_num_samples = [
+                    sum(len(bin_data) for bin_data in model_data) for model_data in all_models_data
+                ]
+
+            # Each model's boxes share one style, so they are collected over the bins and drawn in one call per model
+            all_models_boxes: List[List[np.ndarray]] = [[] for _ in models]
+            all_models_locs: List[List[float]] = [[] for _ in models]
 
-    all_sample_label_x_locs = []
-    all_sample_percs = []
+            for j in range(num_bins):
+                inbetween_locs = []
+                average_samples_per_bin = []
+
+                for hash_idx, model_type in enumerate(models):
+                    if j == 0:
+                        if hash_idx == 1:
+                            circ11 = patches.Patch(
+                                facecolor=cmaps[i],
+                                label=model_type + " " + uncertainty_type,
+                                hatch=hatch_type,
+                                edgecolor="black",
+                            )
+                        else:
+                            circ11 = patches.Patch(facecolor=cmaps[i], label=model_type + " " + uncertainty_type)
+                        circ_patches.append(circ11)
 
-    for i, (uncert_pair) in enumerate(uncertainty_types_list):
-        uncertainty_type = (uncert_pair)[0]
+                    model_data = all_models_data[hash_idx]
 
-        for j in range(num_bins):
-            inbetween_locs = []
-            average_samples_per_bin = []
+                    # Turn data to percentages
+                    displayed_data = _bin_values(
+                        model_data[j], drop_missing=list_comp_bool, scale=100 if convert_to_percent else 1.0
+                    )
 
-            for hash_idx, model_type in enumerate(models):
-                if j == 0:
-                    if hash_idx == 1:
-                        circ11 = patches.Patch(
-                            facecolor=cmaps[i],
-                            label=model_type + " " + uncertainty_type,
-                            hatch=hatch_type,
-                            edgecolor="black",
-                        )
-                    else:
-                        circ11 = patches.Patch(facecolor=cmaps[i], label=model_type + " " + uncertainty_type)
-                    circ_patches.append(circ11)
+                    x_loc = outer_min_x_loc + inner_min_x_loc + middle_min_x_loc
+                    inbetween_locs.append(x_loc)
+                    all_models_boxes[hash_idx].append(displayed_data)
+                    all_models_locs[hash_idx].append(x_loc)
 
-                dict_key = [
-                    x for x in list(target_uncert_dicts.keys()) if (model_type in x) and (uncertainty_type in x)
-                ][0]
-                model_data = target_uncert_dicts[dict_key]
+                    """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
+                    if track_samples:
+                        percent_size = round(len(displayed_data) / all_models_num_samples[hash_idx] * 100, 1)
+                        if show_average_samples:
+                            average_samples_per_bin.append(percent_size)
 
-                if list_comp_bool:
-                    all_b_data = [x for x in model_data[j] if x is not None]
-                else:
-                    all_b_data = model_data[j]
+                        if show_all_samples:
+                            """This adds the number of samples on top of the top whisker, which is centred on the box"""
+                            all_sample_label_x_locs.append(x_loc)
+                            all_sample_percs.append(percent_size)
 
-                orders.append(model_type + uncertainty_type)
+                    inner_min_x_loc += 0.1 + width
 
-                x_loc = [(outer_min_x_loc + inner_min_x_loc + middle_min_x_loc)]
-                inbetween_locs.append(x_loc[0])
+                """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
+                middle_x = sum(inbetween_locs) / len(inbetween_locs)
+                if show_average_samples:
+                    mean_perc, std_perc = _mean_and_std(average_samples_per_bin)
+                    all_sample_label_x_locs.append(middle_x)
+                    all_sample_percs.append([round(mean_perc, 1), round(std_perc, 1)])
 
-                # Turn data to percentages
-                if convert_to_percent:
-                    displayed_data = [(x) * 100 for x in all_b_data]
+                if list_comp_bool:
+                    bin_label_locs.extend(inbetween_locs)
                 else:
-                    displayed_data = all_b_data
-                rect = ax.boxplot(
-                    displayed_data, positions=x_loc, sym="", widths=width, showmeans=True, patch_artist=True
+                    bin_label_locs.append(middle_x)
+
+                middle_min_x_loc += 0.02
+
+            for hash_idx in range(len(models)):
+                hatch = hatch_type if hash_idx == 1 else None
+                rect = _draw_box_group(
+                    ax,
+                    all_models_boxes[hash_idx],
+                    all_models_locs[hash_idx],
+                    width,
+                    box_color,
+                    hatch,
+                    median_style,
+                    mean_style,
                 )
-
-                if show_individual_dots:
-                    # Add some random "jitter" to the x-axis
-                    x = np.random.normal(x_loc, 0.01, size=len(displayed_data))
-                    ax.plot(
-                        x,
-                        displayed_data,
-                        color=cmaps[len(uncertainty_types_list)],
-                        marker=".",
-                        linestyle="None",
-                        alpha=0.75,
-                    )
-
-                # Set color, pattern, median line and mean marker.
-                for r in rect["boxes"]:
-                    r.set(color="black", linewidth=1)
-                    r.set(facecolor=cmaps[i])
-
-                    if hash_idx == 1:
-                        r.set_hatch(hatch_type)
-
-                for median in rect["medians"]:
-                    median.set(color="crimson", linewidth=3)
-
-                for mean in rect["means"]:
-                    mean.set(markerfacecolor="crimson", markeredgecolor="black", markersize=10)
-
-                max_bin_height = max(max(rect["caps"][-1].get_ydata()), max_bin_height)
-
-                """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
-                if show_sample_info != "None":
-                    flattened_model_data = [x for xss in model_data for x in xss]
-                    percent_size = np.round(len(all_b_data) / len(flattened_model_data) * 100, 1)
-                    average_samples_per_bin.append(percent_size)
-
-                    if show_sample_info == "All":
-                        """This adds the number of samples on top of the top whisker"""
-                        (x_l, y), (x_r, _) = rect["caps"][-1].get_xydata()
-                        x_line_center = (x_l + x_r) / 2
-                        all_sample_label_x_locs.append(x_line_center)
-                        all_sample_percs.append(percent_size)
                 all_rects.append(rect)
 
-                inner_min_x_loc += 0.1 + width
-
-            """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
-            if show_sample_info == "Average":
-                middle_x = np.mean(inbetween_locs)
-                mean_perc = np.round(np.mean(average_samples_per_bin), 1)
-                std_perc = np.round(np.std(average_samples_per_bin), 1)
-                all_sample_label_x_locs.append(middle_x)
-                all_sample_percs.append([mean_perc, std_perc])
+                if show_individual_dots:
+                    _draw_individual_dots(ax, rng, all_models_boxes[hash_idx], all_models_locs[hash_idx], dot_color)
 
+            # If lots of bins we must make the gap between plots bigger to prevent overlapping x-tick labels.
             if list_comp_bool:
-                bin_label_locs = bin_label_locs + inbetween_locs
-            else:
-                bin_label_locs.append(np.mean(inbetween_locs))
-
-            middle_min_x_loc += 0.02
-
-        # If lots of bins we must make the gap between plots bigger to prevent overlapping x-tick labels.
-        if list_comp_bool:
-            if num_bins > 9:
-                middle_min_x_loc += 0.25
-            else:
-                middle_min_x_loc += 0.12
-        else:
-            if num_bins > 10:
-                outer_min_x_loc += 0.35
+                if num_bins > 9:
+                    middle_min_x_loc += 0.25
+                else:
+                    middle_min_x_loc += 0.12
             else:
-                outer_min_x_loc += 0.25
+                if num_bins > 10:
+                    outer_min_x_loc += 0.35
+                else:
+                    outer_min_x_loc += 0.25
 
     format_plot(
         ax,
@@ -462,7 +671,35 @@ def generic_box_plot_loop(
         uncertainty_types_list,
         all_sample_percs,
         all_sample_label_x_locs,
-        max_bin_height,
+        _max_top_cap_height(all_rects),
+    )
+
+
+def _build_xaxis_labels(num_bins: int, x_axis_labels: List[str]) -> List[str]:
+    """
+    Builds the x-axis tick labels for one group of bins.
+
+    Args:
+        num_bins (int): The number of bins.
+        x_axis_labels (List[str]): The labels for the x-axis.
+
+    Returns:
+        List[str]: The tick labels for a single group of bins.
+    """
+    if num_bins <= 5:
+        return x_axis_labels[:-1]
+
+    # If too many bins, only show the first and last or it will appear too squished, indicate direction with arrow.
+    if num_bins < 15:
+        number_blanks_0 = [""] * ((num_bins - 3) // 2)
+        number_blanks_1 = [""] * (num_bins - 3 - len(number_blanks_0))
+        return [x_axis_labels[0]] + number_blanks_0 + [r"$\rightarrow$"] + number_blanks_1 + [x_axis_labels[-1]]
+
+    # if more than 15 bins, we must move the first and last labels inwards to prevent overlap.
+    number_blanks_0 = [""] * ((num_bins - 5) // 2)
+    number_blanks_1 = [""] * (num_bins - 5 - len(number_blanks_0))
+    return (
+        [""] + [x_axis_labels[0]] + number_blanks_0 + [r"$\rightarrow$"] + number_blanks_1 + [x_axis_labels[-1]] + [""]
     )
 
 
@@ -483,10 +720,11 @@ def format_plot(
     x_axis_labels: List[str],
     num_bins: int,
     uncertainty_types_list: List[List[str]],
-    all_sample_percs: List[List[float]],
-    all_sample_label_x_locs: List[List[Any]],
+    all_sample_percs: List[Any],
+    all_sample_label_x_locs: List[Any],
     max_bin_height: float,
     comparing_q: bool = False,
+    pdf_pages: Optional[PdfPages] = None,
 ) -> None:
     """
     This function takes a matplotlib Axes object and formats the plot according to the provided parameters.
@@ -508,10 +746,13 @@ def format_plot(
         x_axis_labels: The labels for the x-axis.
         num_bins: The number of bins.
         uncertainty_types_list: The list of uncertainty types.
-        all_sample_percs: The percentage of samples for each bin.
-        all_sample_label_x_locs: The x-axis locations of the sample percentage labels.
+        all_sample_percs: The percentage of samples for each bin. For "Average", a [mean, std] list per group of
+            boxes. For "All", a float per box.
+        all_sample_label_x_locs: The x-axis locations of the sample percentage labels. For "Average", a float per group
+            of boxes. For "All", an [x, y] list per box.
         max_bin_height: The maximum height of a bin in the plot.
         comparing_q: If True, it uses a ticker.FixedFormatter for the x-axis.
+        pdf_pages: A multi-page PDF to add the plot to as a new page. If given, save_path is not used.
 
     Returns:
         None
@@ -519,12 +760,17 @@ def format_plot(
 
     # Show the average samples on top of boxplots, aligned. if lots of bins we can lower the height.
     if show_sample_info != "None":
+        show_average = show_sample_info == "Average"
+        average_label_height = max_bin_height * 0.8
+        # Label templates, filled in per box. Braces of the LaTeX bold command are escaped for str.format.
+        average_label_template = r"$\bf{{PSB}}$: " + "\n" + r"${} \pm$" + "\n" + r"${}$"
+        all_label_template = r"$\bf{{PSB}}$: " + "\n" + "{}%"
         for idx_text, perc_info in enumerate(all_sample_percs):
-            if show_sample_info == "Average":
+            if show_average:
                 ax.text(
                     all_sample_label_x_locs[idx_text],
-                    max_bin_height * 0.8,  # Position
-                    r"$\bf{PSB}$" + ": \n" + r"${} \pm$".format(perc_info[0]) + "\n" + r"${}$".format(perc_info[1]),
+                    average_label_height,  # Position
+                    average_label_template.format(perc_info[0], perc_info[1]),
                     verticalalignment="bottom",  # Centered bottom with line
                     horizontalalignment="center",  # Centered with horizontal line
                     fontsize=25,
@@ -537,50 +783,28 @@ def format_plot(
                 ax.text(
                     all_sample_label_x_locs[idx_text][0],
                     label_height,  # Position
-                    r"$\bf{PSB}$" + ": \n" + str(perc_info) + "%",
+                    all_label_template.format(perc_info),
                     verticalalignment="bottom",  # Centered bottom with line
                     horizontalalignment="center",  # Centered with horizontal line
                     fontsize=25,
                 )
 
+    fig = ax.figure
+
     ax.set_xlabel(x_label, fontsize=font_size_1)
     ax.set_ylabel(y_label, fontsize=font_size_1)
     ax.set_xticks(bin_label_locs)
 
-    plt.subplots_adjust(bottom=0.15)
-    plt.subplots_adjust(left=0.15)
+    fig.subplots_adjust(bottom=0.15, left=0.15)
 
-    plt.xticks(fontsize=font_size_2)
-    plt.yticks(fontsize=font_size_2)
+    ax.tick_params(axis="both", labelsize=font_size_2)
 
     if comparing_q:
         ax.xaxis.set_major_formatter(ticker.FixedFormatter(x_axis_labels))
 
     else:
-        if num_bins <= 5:
-            ax.xaxis.set_major_formatter(ticker.FixedFormatter(x_axis_labels[:-1] * (len(uncertainty_types_list) * 2)))
-        # If too many bins, only show the first and last or it will appear too squished, indicate direction with arrow.
-        elif num_bins < 15:
-            number_blanks_0 = ["" for x in range(math.floor((num_bins - 3) / 2))]
-            number_blanks_1 = ["" for x in range(num_bins - 3 - len(number_blanks_0))]
-            new_labels = (
-                [x_axis_labels[0]] + number_blanks_0 + [r"$\rightarrow$"] + number_blanks_1 + [x_axis_labels[-1]]
-            )
-            ax.xaxis.set_major_formatter(ticker.FixedFormatter(new_labels * (len(uncertainty_types_list) * 2)))
-        # if more than 15 bins, we must move the first and last labels inwards to prevent overlap.
-        else:
-            number_blanks_0 = ["" for x in range(math.floor((num_bins - 5) / 2))]
-            number_blanks_1 = ["" for x in range(num_bins - 5 - len(number_blanks_0))]
-            new_labels = (
-                [""]
-                + [x_axis_labels[0]]
-                + number_blanks_0
-                + [r"$\rightarrow$"]
-                + number_blanks_1
-                + [x_axis_labels[-1]]
-                + [""]
-            )
-            ax.xaxis.set_major_formatter(ticker.FixedFormatter(new_labels * (len(uncertainty_types_list) * 2)))
+        new_labels = _build_xaxis_labels(num_bins, x_axis_labels)
+        ax.xaxis.set_major_formatter(ticker.FixedFormatter(new_labels * (len(uncertainty_types_list) * 2)))
 
     if to_log:
         ax.set_yscale("symlog", base=2)
@@ -592,7 +816,7 @@ def format_plot(
 
     # If using percent, doesnt make sense to show any y tick above 100
     if convert_to_percent and y_lim > 100:
-        plt.yticks(np.arange(0, y_lim, 20))
+        ax.set_yticks(np.arange(0, y_lim, 20))
 
     # Add more to legend, add the mean symbol and median symbol.
     red_triangle_mean = mlines.Line2D(
@@ -620,13 +844,16 @@ def format_plot(
         shadow=False,
     )
 
-    if save_path is not None:
-        plt.gcf().set_size_inches(16.0, 10.0)
+    fig.set_size_inches(16.0, 10.0)
+    if pdf_pages is not None:
+        plt.tight_layout()
+        pdf_pages.savefig(fig, dpi=600, bbox_inches="tight", pad_inches=0.1)
+        plt.close()
+    elif save_path is not None:
         plt.tight_layout()
         plt.savefig(save_path, dpi=600, bbox_inches="tight", pad_inches=0.1)
         plt.close()
     else:
-        plt.gcf().set_size_inches(16.0, 10.0)
         plt.show()
         plt.close()
 
@@ -674,7 +901,9 @@ def box_plot_per_model(
     hatch_type = "o"
     plt.style.use("fivethirtyeight")
 
-    orders = []
+    # One generator per figure for the x-axis jitter of the individual dots
+    rng = np.random.default_rng()
+
     ax = plt.gca()
 
     ax.xaxis.grid(False)
@@ -686,112 +915,98 @@ def box_plot_per_model(
     inner_min_x_loc = 0.0
 
     circ_patches = []
-    max_bin_height = 0.0
-
-    all_sample_label_x_locs = []
-    all_sample_percs = []
-
-    for i, (uncert_pair) in enumerate(uncertainty_types_list):
-        uncertainty_type = (uncert_pair)[0]
-        for hash_idx, model_type in enumerate(models):
-            inbetween_locs = []
-            average_samples_per_bin = []
-
-            for j in range(num_bins):
-                if j == 0:
-                    if hash_idx == 1:
-                        circ11 = patches.Patch(
-                            facecolor=cmaps[i],
-                            label=model_type + " " + uncertainty_type,
-                            hatch=hatch_type,
-                            edgecolor="black",
-                        )
-                    else:
-                        circ11 = patches.Patch(facecolor=cmaps[i], label=model_type + " " + uncertainty_type)
-                    circ_patches.append(circ11)
-
-                dict_key = [
-                    x for x in list(target_uncert_dicts.keys()) if (model_type in x) and (uncertainty_type in x)
-                ][0]
-                model_data = target_uncert_dicts[dict_key]
-                all_b_data = [x for x in model_data[j] if x is not None]
-
-                orders.append(model_type + uncertainty_type)
-
-                width = 0.25
-
-                x_loc = [(outer_min_x_loc + inner_min_x_loc + middle_min_x_loc)]
-                inbetween_locs.append(x_loc[0])
-
-                # Turn data to percentages
-                if convert_to_percent:
-                    displayed_data = [(x) * 100 for x in all_b_data]
-                else:
-                    displayed_data = all_b_data
-                rect = ax.boxplot(
-                    displayed_data, positions=x_loc, sym="", widths=width, showmeans=True, patch_artist=True
-                )
+    all_sample_label_x_locs: List[Any] = []
+    all_sample_percs: List[Any] = []
+
+    # Style values shared by every box, looked up once rather than per box.
+    dot_color = cmaps[len(uncertainty_types_list)]
+    median_style = {"color": "crimson", "linewidth": 3}
+    mean_style = {"markerfacecolor": "crimson", "markeredgecolor": "black", "markersize": 10}
+
+    dict_index = _build_dict_index(target_uncert_dicts, models, uncertainty_types_list)
+
+    # Sample information mode, checked once rather than for every box
+    track_samples = show_sample_info != "None"
+    show_all_samples = show_sample_info == "All"
+    show_average_samples = show_sample_info == "Average"
+
+    # Draw every box with interactive mode off so interactive backends do not redraw after each one.
+    with plt.ioff():
+        for i, (uncert_pair) in enumerate(uncertainty_types_list):
+            uncertainty_type = (uncert_pair)[0]
+            box_color = cmaps[i]
+            for hash_idx, model_type in enumerate(models):
+                inbetween_locs = []
+                average_samples_per_bin = []
+
+                # Get the model's data for this uncertainty type once, rather than looking it up for every bin
+                model_data = target_uncert_dicts[dict_index[(model_type, uncertainty_type)]]
+                if track_samples:
+                    num_model_samples = sum(len(bin_data) for bin_data in model_data)
+
+                # All boxes of the model share one style, so they are collected over the bins and drawn in one call
+                model_boxes: List[np.ndarray] = []
+                model_locs: List[float] = []
+
+                for j in range(num_bins):
+                    if j == 0:
+                        if hash_idx == 1:
+                            circ11 = patches.Patch(
+                                facecolor=cmaps[i],
+                                label=model_type + " " + uncertainty_type,
+                                hatch=hatch_type,
+                                edgecolor="black",
+                            )
+                        else:
+                            circ11 = patches.Patch(facecolor=cmaps[i], label=model_type + " " + uncertainty_type)
+                        circ_patches.append(circ11)
 
-                if show_individual_dots:
-                    # Add some random "jitter" to the x-axis
-                    x = np.random.normal(x_loc, 0.01, size=len(displayed_data))
-                    ax.plot(
-                        x,
-                        displayed_data,
-                        color=cmaps[len(uncertainty_types_list)],
-                        marker=".",
-                        linestyle="None",
-                        alpha=0.75,
-                    )
+                    # Turn data to percentages
+                    displayed_data = _bin_values(model_data[j], scale=100 if convert_to_percent else 1.0)
 
-                # Set color, pattern, median line and mean marker.
-                for r in rect["boxes"]:
-                    r.set(color="black", linewidth=1)
-                    r.set(facecolor=cmaps[i])
+                    width = 0.25
 
-                    if hash_idx == 1:
-                        r.set_hatch(hatch_type)
-                for median in rect["medians"]:
-                    median.set(color="crimson", linewidth=3)
+                    x_loc = outer_min_x_loc + inner_min_x_loc + middle_min_x_loc
+                    inbetween_locs.append(x_loc)
+                    model_boxes.append(displayed_data)
+                    model_locs.append(x_loc)
 
-                for mean in rect["means"]:
-                    mean.set(markerfacecolor="crimson", markeredgecolor="black", markersize=10)
+                    """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
+                    if track_samples:
+                        percent_size = round(len(displayed_data) / num_model_samples * 100, 1)
+                        if show_average_samples:
+                            average_samples_per_bin.append(percent_size)
 
-                max_bin_height = max(max(rect["caps"][-1].get_ydata()), max_bin_height)
+                        if show_all_samples:
+                            """This adds the number of samples on top of the top whisker, which is centred on the box"""
+                            all_sample_label_x_locs.append(x_loc)
+                            all_sample_percs.append(percent_size)
 
-                """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
-                if show_sample_info != "None":
-                    flattened_model_data = [x for xss in model_data for x in xss]
-                    percent_size = np.round(len(all_b_data) / len(flattened_model_data) * 100, 1)
-                    average_samples_per_bin.append(percent_size)
+                    inner_min_x_loc += 0.1 + width
 
-                    if show_sample_info == "All":
-                        """This adds the number of samples on top of the top whisker"""
-                        (x_l, y), (x_r, _) = rect["caps"][-1].get_xydata()
-                        x_line_center = (x_l + x_r) / 2
-                        all_sample_label_x_locs.append(x_line_center)
-                        all_sample_percs.append(percent_size)
+                hatch = hatch_type if hash_idx == 1 else None
+                rect = _draw_box_group(ax, model_boxes, model_locs, width, box_color, hatch, median_style, mean_style)
                 all_rects.append(rect)
 
-                inner_min_x_loc += 0.1 + width
+                if show_individual_dots:
+                    _draw_individual_dots(ax, rng, model_boxes, model_locs, dot_color)
 
-            """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
-            if show_sample_info == "Average":
-                middle_x = np.mean(inbetween_locs)
-                mean_perc = np.round(np.mean(average_samples_per_bin), 1)
-                std_perc = np.round(np.std(average_samples_per_bin), 1)
-                all_sample_label_x_locs.append(middle_x)
-                all_sample_percs.append([mean_perc, std_perc])
+                """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
+                if show_average_samples:
+                    middle_x = sum(inbetween_locs) / len(inbetween_locs)
+                    mean_perc, std_perc = _mean_and_std(average_samples_per_bin)
+                    all_sample_label_x_locs.append(middle_x)
+                    all_sample_percs.append([round(mean_perc, 1), round(std_perc, 1)])
 
-            bin_label_locs = bin_label_locs + inbetween_locs
+                bin_label_locs.extend(inbetween_locs)
 
-            # IF lots of bins we must make the gap between plots bigger to prevent overlapping x-tick labels.
-            if num_bins > 9:
-                middle_min_x_loc += 0.25
-            else:
-                middle_min_x_loc += 0.12
+                # IF lots of bins we must make the gap between plots bigger to prevent overlapping x-tick labels.
+                if num_bins > 9:
+                    middle_min_x_loc += 0.25
+                else:
+                    middle_min_x_loc += 0.12
 
-        outer_min_x_loc += 0.24
+            outer_min_x_loc += 0.24
 
     format_plot(
         ax,
@@ -812,7 +1027,7 @@ def box_plot_per_model(
         uncertainty_types_list,
         all_sample_percs,
         all_sample_label_x_locs,
-        max_bin_height,
+        _max_top_cap_height(all_rects),
     )
 
 
@@ -832,6 +1047,7 @@ def box_plot_comparing_q(
     convert_to_percent: bool = True,
     to_log: bool = False,
     show_individual_dots: bool = True,
+    pdf_pages: Optional[PdfPages] = None,
 ) -> None:
     """
     Creates a box plot of data, using Q (# Bins) on the x-axis.
@@ -869,11 +1085,15 @@ def box_plot_comparing_q(
             Whether to set the y-axis to logarithmic scale. Defaults to False.
         show_individual_dots (bool, optional):
             Whether to show individual data points. Defaults to True.
+        pdf_pages (PdfPages, optional):
+            Multi-page PDF to add the plot to as a new page, instead of saving it to save_path. Defaults to None.
     """
 
     plt.style.use("fivethirtyeight")
 
-    orders = []
+    # One generator per figure for the x-axis jitter of the individual dots
+    rng = np.random.default_rng()
+
     ax = plt.gca()
     ax.xaxis.grid(False)
 
@@ -897,80 +1117,83 @@ def box_plot_comparing_q(
     )
     circ_patches.append(circ11)
 
-    max_bin_height = 0
-    all_sample_label_x_locs = []
-    all_sample_percs = []
+    all_sample_label_x_locs: List[Any] = []
+    all_sample_percs: List[Any] = []
 
-    for idx, q_value in enumerate(x_axis_labels):
-        inbetween_locs = []
-        target_uncert_dicts = target_uncert_dicts_list[idx]
+    # Get the model and uncertainty type data for every Q once
+    all_q_model_data = [
+        target_uncert_dicts[_find_dict_key(target_uncert_dicts, model_type, uncertainty_type)]
+        for target_uncert_dicts in target_uncert_dicts_list[: len(x_axis_labels)]
+    ]
 
-        # Get key for the model and uncetainty type for data
-        dict_key = [x for x in list(target_uncert_dicts.keys()) if (model_type in x) and (uncertainty_type in x)][0]
-        model_data = target_uncert_dicts[dict_key]
-        average_samples_per_bin = []
-        # Loop through each bin and display the data
-        for j in range(len(model_data)):
-            all_b_data = [x for x in model_data[j] if x is not None]
+    # Sample information mode, checked once rather than for every box
+    track_samples = show_sample_info != "None"
+    show_all_samples = show_sample_info == "All"
+    show_average_samples = show_sample_info == "Average"
 
-            orders.append(model_type + uncertainty_type)
+    # Draw every box with interactive mode off so interactive backends do not redraw after each one.
+    with plt.ioff():
+        for idx, q_value in enumerate(x_axis_labels):
+            inbetween_locs = []
+            model_data = all_q_model_data[idx]
+            if track_samples:
+                num_model_samples = sum(len(bin_data) for bin_data in model_data)
+            average_samples_per_bin = []
+            # Drop missing values and turn data to percentages for all bins of this Q at once
+            model_bins = _split_bin_values(model_data, scale=100 if convert_to_percent else 1.0)
 
+            # Boxes get narrower as Q grows, the width is the same for every bin of this Q
             width = 0.2 * (4 / 5) ** idx
 
-            x_loc = [(outer_min_x_loc + inner_min_x_loc + middle_min_x_loc)]
-            inbetween_locs.append(x_loc[0])
+            # Loop through each bin and display the data
+            for displayed_data in model_bins:
+                x_loc = outer_min_x_loc + inner_min_x_loc + middle_min_x_loc
+                inbetween_locs.append(x_loc)
+                rect = ax.boxplot(
+                    displayed_data, positions=[x_loc], sym="", widths=width, showmeans=True, patch_artist=True
+                )
 
-            # Turn data to percentages
-            if convert_to_percent:
-                displayed_data = [(x) * 100 for x in all_b_data]
-            else:
-                displayed_data = all_b_data
-            rect = ax.boxplot(displayed_data, positions=x_loc, sym="", widths=width, showmeans=True, patch_artist=True)
-
-            max_bin_height = max(max(rect["caps"][-1].get_ydata()), max_bin_height)
-
-            if show_individual_dots:
-                # Add some random "jitter" to the x-axis
-                x = np.random.normal(x_loc, 0.01, size=len(displayed_data))
-                ax.plot(x, displayed_data, color="crimson", marker=".", linestyle="None", alpha=0.2)
-
-            # Set color, pattern, median line and mean marker.
-            for r in rect["boxes"]:
-                r.set(color="black", linewidth=1)
-                r.set(facecolor=color)
-                r.set_hatch(hatch_type)
-            for median in rect["medians"]:
-                median.set(color="crimson", linewidth=3)
-
-            for mean in rect["means"]:
-                mean.set(markerfacecolor="crimson", markeredgecolor="black", markersize=10)
-
-            """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
-            if show_sample_info != "None":
-                flattened_model_data = [x for xss in model_data for x in xss]
-                percent_size = np.round(len(all_b_data) / len(flattened_model_data) * 100, 1)
-                average_samples_per_bin.append(percent_size)
-
-                if show_sample_info == "All":
-                    """This adds the number of samples on top of the top whisker"""
-                    (x_l, y), (x_r, _) = rect["caps"][-1].get_xydata()
-                    x_line_center = (x_l + x_r) / 2
-                    all_sample_label_x_locs.append([x_line_center, y + 0.5])
-                    all_sample_percs.append(percent_size)
-
-            all_rects.append(rect)
-            inner_min_x_loc += 0.02 + width
-
-        outer_min_x_loc += 0.2
-        bin_label_locs.append(np.mean(inbetween_locs))
-
-        """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
-        if show_sample_info == "Average":
-            middle_x = np.mean(inbetween_locs)
-            mean_perc = np.round(np.mean(average_samples_per_bin), 1)
-            std_perc = np.round(np.std(average_samples_per_bin), 1)
-            all_sample_label_x_locs.append(middle_x)
-            all_sample_percs.append([mean_perc, std_perc])
+                if show_individual_dots:
+                    # Add some random "jitter" to the x-axis
+                    x = rng.normal(x_loc, 0.01, size=displayed_data.size)
+                    ax.plot(x, displayed_data, color="crimson", marker=".", linestyle="None", alpha=0.2)
+
+                # Set color, pattern, median line and mean marker.
+                for r in rect["boxes"]:
+                    r.set(color="black", linewidth=1)
+                    r.set(facecolor=color)
+                    r.set_hatch(hatch_type)
+                for median in rect["medians"]:
+                    median.set(color="crimson", linewidth=3)
+
+                for mean in rect["means"]:
+                    mean.set(markerfacecolor="crimson", markeredgecolor="black", markersize=10)
+
+                """If we are showing sample statistics, keep track of it and display after on top of biggest whisker."""
+                if track_samples:
+                    percent_size = round(len(displayed_data) / num_model_samples * 100, 1)
+                    if show_average_samples:
+                        average_samples_per_bin.append(percent_size)
+
+                    if show_all_samples:
+                        """This adds the number of samples on top of the top whisker"""
+                        (x_l, y), (x_r, _) = rect["caps"][-1].get_xydata()
+                        x_line_center = (x_l + x_r) / 2
+                        all_sample_label_x_locs.append([x_line_center, y + 0.5])
+                        all_sample_percs.append(percent_size)
+
+                all_rects.append(rect)
+                inner_min_x_loc += 0.02 + width
+
+            outer_min_x_loc += 0.2
+            middle_x = sum(inbetween_locs) / len(inbetween_locs)
+            bin_label_locs.append(middle_x)
+
+            """ Keep track of average sample statistics. Plot at the END so we know what the max height for all Qs are."""
+            if show_average_samples:
+                mean_perc, std_perc = _mean_and_std(average_samples_per_bin)
+                all_sample_label_x_locs.append(middle_x)
+                all_sample_percs.append([round(mean_perc, 1), round(std_perc, 1)])
 
     format_plot(
         ax,
@@ -991,11 +1214,55 @@ def box_plot_comparing_q(
         uncertainty_type_tuple,
         all_sample_percs,
         all_sample_label_x_locs,
-        max_bin_height,
+        _max_top_cap_height(all_rects),
         comparing_q=True,
+        pdf_pages=pdf_pages,
     )
 
 
+def _cumulative_error_curve(errors: np.ndarray, in_place: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the cumulative error curve: the sorted errors and the percentage of samples at or below each of them.
+
+    Args:
+        errors (np.ndarray): Array of errors.
+        in_place (bool, optional): Sort `errors` itself instead of a copy, for arrays that are already a temporary
+            copy such as a masked selection. Defaults to False.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The sorted errors and the cumulative percentage of samples, from 0 to 100.
+    """
+    if in_place:
+        errors.sort()
+        sorted_errors = errors
+    else:
+        sorted_errors = np.sort(errors)
+    return sorted_errors, np.linspace(0.0, 100.0, sorted_errors.size)
+
+
+def _bin_mask(bins_arr: np.ndarray, bins: Union[List[int], np.ndarray]) -> np.ndarray:
+    """
+    Marks the samples whose bin is one of the selected bins.
+
+    Bin indices are small non-negative integers, so the selected bins are looked up in a boolean bucket array indexed
+    by bin. Any other input falls back to np.isin.
+
+    Args:
+        bins_arr (np.ndarray): Bin index of each sample.
+        bins (Union[List[int], np.ndarray]): The selected bins.
+
+    Returns:
+        np.ndarray: Boolean mask, True for samples in one of the selected bins.
+    """
+    selected = np.asarray(bins)
+    if bins_arr.size == 0 or bins_arr.dtype.kind not in "iu" or selected.dtype.kind not in "iu" or bins_arr.min() < 0:
+        return np.isin(bins_arr, bins)
+
+    bucket = np.zeros(int(bins_arr.max()) + 1, dtype=bool)
+    bucket[selected[(selected >= 0) & (selected < bucket.size)]] = True
+    return bucket[bins_arr]
+
+
 def plot_cumulative(
     cmaps: List[str],
     data_struct: Dict[str, pd.DataFrame],
@@ -1006,6 +1273,8 @@ def plot_cumulative(
     compare_to_all: bool = False,
     save_path: Optional[str] = None,
     error_scaling_factor: float = 1,
+    curve_cache: Optional[Dict[Tuple[str, str, Optional[Tuple[int, ...]]], Tuple[np.ndarray, np.ndarray]]] = None,
+    ax: Optional[plt.Axes] = None,
 ) -> None:
     """
     Plots cumulative errors.
@@ -1020,16 +1289,28 @@ def plot_cumulative(
         compare_to_all: Whether to compare the given subset of bins to all the data (default=False).
         save_path: The path to save plot to. If None, displays on screen (default=None).
         error_scaling_factor (float, optional): Scaling factor for error. Defaults to 1.0.
+        curve_cache (Dict, optional): Cumulative error curves keyed by (model, uncertainty, bins), where bins is None
+            for the curve over all the data. Pass the same dictionary to repeated calls on the same data_struct and
+            error_scaling_factor to reuse their curves. Defaults to None (no reuse across calls).
+        ax (plt.Axes, optional): Axes to clear and draw on, so repeated calls can share one figure. The caller owns the
+            figure and closes it. Defaults to None (a new figure is created, and closed once saved or shown).
     """
 
     # make sure bins is a list and not a single value
     bins = [bins] if not isinstance(bins, (list, np.ndarray)) else bins
+    bins_key = tuple(np.asarray(bins).ravel().tolist())
+    if curve_cache is None:
+        curve_cache = {}
 
     plt.style.use("ggplot")
 
-    _ = plt.figure()
-
-    ax = plt.gca()
+    close_figure = ax is None
+    if ax is None:
+        _, ax = plt.subplots()
+    else:
+        # Reset the shared axes and make them current for the pyplot calls below
+        ax.clear()
+        plt.sca(ax)
     plt.xticks(fontsize=10)
     plt.yticks(fontsize=10)
 
@@ -1038,58 +1319,78 @@ def plot_cumulative(
     plt.title(title)
 
     ax.set_xscale("log")
+
+    # Build the bin and error column names once per uncertainty, then pull those columns out of the dataframes
+    # once, as arrays
+    column_names = {
+        uncert_pair[0]: (uncert_pair[0] + " Uncertainty bins", uncert_pair[0] + " Error")
+        for uncert_pair in uncertainty_types
+    }
+    model_columns = {}
+    for model_type in models:
+        dataframe = data_struct[model_type]
+        for uncertainty, (bins_column, error_column) in column_names.items():
+            model_columns[(model_type, uncertainty)] = (
+                dataframe[bins_column].to_numpy(),
+                dataframe[error_column].to_numpy() * error_scaling_factor,
+            )
+
     line_styles = [":", "-", "dotted", "-."]
+
+    # All curves are collected and drawn as one LineCollection, with a legend entry per curve
+    curves = []
+    curve_colors = []
+    curve_styles = []
+    legend_handles = []
     for i, (uncert_pair) in enumerate(uncertainty_types):
         uncertainty = (uncert_pair)[0]
         color = cmaps[i]
         for hash_idx, model_type in enumerate(models):
             line = line_styles[hash_idx]
-
-            # Filter only the bins selected
-            dataframe = data_struct[model_type]
-            model_un_errors = (
-                dataframe[dataframe[uncertainty + " Uncertainty bins"].isin(bins)][uncertainty + " Error"].values
-                * error_scaling_factor
-            )
-
-            p = 100 * np.arange(len(model_un_errors)) / (len(model_un_errors) - 1)
-
-            sorted_errors = np.sort(model_un_errors)
-
-            ax.plot(
-                sorted_errors,
-                p,
-                label=model_type + " " + uncertainty,
-                color=color,
-                linestyle=line,
-                dash_capstyle="round",
+            label = f"{model_type} {uncertainty}"
+            bins_arr, errors_arr = model_columns[(model_type, uncertainty)]
+
+            # Filter only the bins selected. Boolean indexing already returns a copy, so sort that copy in place.
+            curve_key = (model_type, uncertainty, bins_key)
+            if curve_key not in curve_cache:
+                curve_cache[curve_key] = _cumulative_error_curve(errors_arr[_bin_mask(bins_arr, bins)], in_place=True)
+            sorted_errors, p = curve_cache[curve_key]
+
+            curves.append(np.column_stack((sorted_errors, p)))
+            curve_colors.append(color)
+            curve_styles.append(line)
+            legend_handles.append(
+                mlines.Line2D([], [], label=label, color=color, linestyle=line, dash_capstyle="round")
             )
 
             if compare_to_all:
-                dataframe = data_struct[model_type]
-                model_un_errors = dataframe[uncertainty + " Error"].values * error_scaling_factor
-
-                p = 100 * np.arange(len(model_un_errors)) / (len(model_un_errors) - 1)
-
-                sorted_errors = np.sort(model_un_errors)
+                all_key = (model_type, uncertainty, None)
+                if all_key not in curve_cache:
+                    curve_cache[all_key] = _cumulative_error_curve(errors_arr)
+                sorted_errors, p = curve_cache[all_key]
                 line = line_styles[len(models) + hash_idx]
-                ax.plot(
-                    sorted_errors,
-                    p,
-                    label=model_type + " " + uncertainty,
-                    color=color,
-                    linestyle=line,
-                    dash_capstyle="round",
+                curves.append(np.column_stack((sorted_errors, p)))
+                curve_colors.append(color)
+                curve_styles.append(line)
+                legend_handles.append(
+                    mlines.Line2D([], [], label=label, color=color, linestyle=line, dash_capstyle="round")
                 )
 
-    handles, labels = ax.get_legend_handles_labels()
-    ax.legend(handles, labels, prop={"size": 10})
+    ax.add_collection(
+        LineCollection(curves, colors=curve_colors, linestyles=curve_styles, capstyle="round"), autolim=False
+    )
+    # Update the data limits from the curve points, as ax.plot does, so the log x-axis is scaled the same way
+    if curves:
+        ax.update_datalim(np.concatenate(curves))
+    ax.autoscale_view()
+
+    ax.legend(handles=legend_handles, prop={"size": 10})
     plt.axvline(x=5, color=cmaps[3])
 
     for axis in [ax.xaxis, ax.yaxis]:
         axis.set_major_formatter(ScalarFormatter())
 
-    plt.xticks([1, 2, 3, 4, 5, 10, 20, 30])
+    ax.set_xticks([1, 2, 3, 4, 5, 10, 20, 30])
 
     ax.xaxis.label.set_color("black")
     ax.yaxis.label.set_color("black")
@@ -1099,10 +1400,10 @@ def plot_cumulative(
 
     if save_path is not None:
         plt.savefig(save_path + "cumulative_error.pdf", dpi=100, bbox_inches="tight", pad_inches=0.2)
-        plt.close()
     else:
         plt.gcf().set_size_inches(16.0, 10.0)
         plt.show()
+    if close_figure:
         plt.close()
 
 
@@ -1236,6 +1537,8 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
 
         if save_figures_bool:
             save_location = save_folder
+            # Every figure file name starts with the folder and preamble, joined once
+            save_prefix = os.path.join(save_folder, save_file_preamble)
         else:
             save_location = None
 
@@ -1256,6 +1559,14 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
 
         # Plot cumulative error figure for all predictions
         if display_settings["cumulative_error"]:
+            # The B1 curves are shared by the B1-only figure and the per-model comparison figures
+            cumulative_curves: Dict[Tuple[str, str, Optional[Tuple[int, ...]]], Tuple[np.ndarray, np.ndarray]] = {}
+            # Saved figures are drawn one after another on the same axes. Shown figures each get their own.
+            cumulative_fig: Optional[plt.Figure] = None
+            cumulative_ax: Optional[plt.Axes] = None
+            if save_location is not None:
+                plt.style.use("ggplot")
+                cumulative_fig, cumulative_ax = plt.subplots()
             plot_cumulative(
                 cmaps,
                 bins_all_targets,
@@ -1265,6 +1576,8 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                 "Cumulative error for ALL predictions, dataset " + dataset,
                 save_path=save_location,
                 error_scaling_factor=error_scaling_factor,
+                curve_cache=cumulative_curves,
+                ax=cumulative_ax,
             )
             # Plot cumulative error figure for B1 only predictions
             plot_cumulative(
@@ -1276,6 +1589,8 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                 "Cumulative error for B1 predictions, dataset " + dataset,
                 save_path=save_location,
                 error_scaling_factor=error_scaling_factor,
+                curve_cache=cumulative_curves,
+                ax=cumulative_ax,
             )
 
             # Plot cumulative error figure comparing B1 and ALL, for both models
@@ -1290,7 +1605,11 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                     compare_to_all=True,
                     save_path=save_location,
                     error_scaling_factor=error_scaling_factor,
+                    curve_cache=cumulative_curves,
+                    ax=cumulative_ax,
                 )
+            if cumulative_fig is not None:
+                plt.close(cumulative_fig)
 
         # Set x_axis labels for following plots.
         x_axis_labels = [r"$B_{{{}}}$".format(num_bins_display + 1 - (i + 1)) for i in range(num_bins_display + 1)]
@@ -1304,9 +1623,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                     dotted_addition = "_dotted"
                 else:
                     dotted_addition = "_undotted"
-                save_location = os.path.join(
-                    save_folder, save_file_preamble + dotted_addition + "_error_all_targets.pdf"
-                )
+                save_location = f"{save_prefix}{dotted_addition}_error_all_targets.pdf"
 
             box_plot_per_model(
                 cmaps,
@@ -1330,10 +1647,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                 for idx_l, target_data in enumerate(all_bins_concat_targets_sep_all_error):
                     if idx_l in ind_targets_to_show or ind_targets_to_show == [-1]:
                         if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder,
-                                save_file_preamble + dotted_addition + "_error_target_" + str(idx_l) + ".pdf",
-                            )
+                            save_location = f"{save_prefix}{dotted_addition}_error_target_{idx_l}.pdf"
 
                         logger.info("individual error for T%s", idx_l)
 
@@ -1357,9 +1671,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
             logger.info("Mean error")
 
             if save_figures_bool:
-                save_location = os.path.join(
-                    save_folder, save_file_preamble + dotted_addition + "mean_error_folds_all_targets.pdf"
-                )
+                save_location = f"{save_prefix}{dotted_addition}mean_error_folds_all_targets.pdf"
 
             box_plot_per_model(
                 cmaps,
@@ -1380,7 +1692,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
         if display_settings["error_bounds"]:
             logger.info(" errorbound acc for all targets.")
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_errorbound_all_targets.pdf")
+                save_location = f"{save_prefix}_errorbound_all_targets.pdf"
 
             generic_box_plot_loop(
                 cmaps,
@@ -1406,9 +1718,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                 for idx_l, target_data in enumerate(all_bins_concat_targets_sep_all_errorbound):
                     if idx_l in ind_targets_to_show or ind_targets_to_show == [-1]:
                         if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder, save_file_preamble + "_errorbound_target_" + str(idx_l) + ".pdf"
-                            )
+                            save_location = f"{save_prefix}_errorbound_target_{idx_l}.pdf"
 
                         logger.info("individual errorbound acc for T%s", idx_l)
 
@@ -1435,7 +1745,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
         if display_settings["jaccard"]:
             logger.info("Plot jaccard for all targets.")
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_jaccard_all_targets.pdf")
+                save_location = f"{save_prefix}_jaccard_all_targets.pdf"
 
             generic_box_plot_loop(
                 cmaps,
@@ -1458,7 +1768,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
 
             # mean recall for each bin
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_recall_jaccard_all_targets.pdf")
+                save_location = f"{save_prefix}_recall_jaccard_all_targets.pdf"
 
             generic_box_plot_loop(
                 cmaps,
@@ -1482,7 +1792,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
 
             # mean precision for each bin
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_precision_jaccard_all_targets.pdf")
+                save_location = f"{save_prefix}_precision_jaccard_all_targets.pdf"
 
             generic_box_plot_loop(
                 cmaps,
@@ -1510,9 +1820,7 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                 for idx_l, target_data in enumerate(all_bins_concat_targets_sep_all_jacc):
                     if idx_l in ind_targets_to_show or ind_targets_to_show == [-1]:
                         if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder, save_file_preamble + "jaccard_target_" + str(idx_l) + ".pdf"
-                            )
+                            save_location = f"{save_prefix}jaccard_target_{idx_l}.pdf"
 
                         logger.info("individual jaccard for T%s", idx_l)
 
@@ -1536,18 +1844,202 @@ def generate_fig_individual_bin_comparison(data: Tuple, display_settings: dict)
                         )
 
 
+def _qbin_metrics(
+    model_list: List[str],
+    targets: List[int],
+    saved_bins_path_pre: str,
+    dataset: str,
+    uncertainty_error_pair_list: List[List[str]],
+    num_bins: int,
+    num_folds: int,
+    error_scaling_factor: float,
+    combine_middle_bins: bool,
+    metric_names: Tuple[str, ...] = ("errors", "jaccard", "error_bounds"),
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the binned predictions of one Q and evaluates the requested metrics: their errors ("errors"), Jaccard
+    indices ("jaccard") and error bounds ("error_bounds").
+
+    Args:
+        model_list (List[str]): The models to evaluate.
+        targets (List[int]): The targets to evaluate.
+        saved_bins_path_pre (str): Preamble to path of where the predicted quantile bins are saved.
+        dataset (str): The dataset the bins were predicted on.
+        uncertainty_error_pair_list (List[List[str]]): The uncertainty, error and uncertainty column triplets.
+        num_bins (int): The number of bins, Q.
+        num_folds (int): The number of cross-validation folds.
+        error_scaling_factor (float): Scaling factor for error.
+        combine_middle_bins (bool): Whether the middle bins are combined.
+        metric_names (Tuple[str, ...], optional): The metrics to evaluate. Defaults to all three.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The results of get_mean_errors, evaluate_jaccard and evaluate_bounds, keyed by the
+            name of each requested metric.
+    """
+    bins_all_targets, _, bounds_all_targets, _ = generate_struct_for_qbin(
+        model_list, targets, saved_bins_path_pre, dataset
+    )
+
+    metrics = {}
+    if "errors" in metric_names:
+        # Get mean errors bin-wise, get all errors concatenated together bin-wise, and seperate by target.
+        metrics["errors"] = get_mean_errors(
+            bins_all_targets,
+            uncertainty_error_pair_list,
+            num_bins,
+            targets,
+            num_folds=num_folds,
+            error_scaling_factor=error_scaling_factor,
+            combine_middle_bins=combine_middle_bins,
+        )
+    if "jaccard" in metric_names:
+        metrics["jaccard"] = evaluate_jaccard(
+            bins_all_targets,
+            uncertainty_error_pair_list,
+            num_bins,
+            targets,
+            num_folds=num_folds,
+            combine_middle_bins=combine_middle_bins,
+        )
+    if "error_bounds" in metric_names:
+        metrics["error_bounds"] = evaluate_bounds(
+            bounds_all_targets,
+            bins_all_targets,
+            uncertainty_error_pair_list,
+            num_bins,
+            targets,
+            num_folds,
+            combine_middle_bins=combine_middle_bins,
+        )
+    return metrics
+
+
+def _qbin_metrics_key(
+    model_list: List[str],
+    targets: List[int],
+    saved_bins_path_pre: str,
+    dataset: str,
+    uncertainty_error_pair_list: List[List[str]],
+    num_bins: int,
+    num_folds: int,
+    error_scaling_factor: float,
+    combine_middle_bins: bool,
+) -> Tuple:
+    """
+    Builds the cache key of the metrics of one Q from the arguments of _qbin_metrics.
+
+    The key also holds the modification times of the files read by generate_struct_for_qbin, so bins saved again since
+    are evaluated again. Missing files get no modification time and are left for generate_struct_for_qbin to report.
+    Only built when a metrics_cache is given.
+
+    Args:
+        model_list, targets, saved_bins_path_pre, dataset, uncertainty_error_pair_list, num_bins, num_folds,
+            error_scaling_factor, combine_middle_bins: As for _qbin_metrics.
+
+    Returns:
+        Tuple: The hashable cache key.
+    """
+    source_paths = [
+        os.path.join(saved_bins_path_pre, model, dataset, file_name + str(target_idx) + ".csv")
+        for model in model_list
+        for target_idx in targets
+        for file_name in ("res_predicted_bins_t", "estimated_error_bounds_t")
+    ]
+    source_mtimes = tuple(os.stat(path).st_mtime_ns if os.path.exists(path) else None for path in source_paths)
+    return (
+        tuple(model_list),
+        tuple(targets),
+        saved_bins_path_pre,
+        dataset,
+        tuple(tuple(pair) for pair in uncertainty_error_pair_list),
+        num_bins,
+        num_folds,
+        error_scaling_factor,
+        combine_middle_bins,
+        source_mtimes,
+    )
+
+
+def _all_qbin_metrics(
+    all_q_args: List[Tuple],
+    metric_names: Tuple[str, ...],
+    num_jobs: Optional[int] = None,
+    metrics_cache: Optional[Dict[Tuple, Dict[str, Dict[str, Any]]]] = None,
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Evaluates the requested metrics of every Q with _qbin_metrics. The Qs are independent of each other and are
+    evaluated in parallel.
+
+    Args:
+        all_q_args (List[Tuple]): The arguments of _qbin_metrics for each Q, without metric_names.
+        metric_names (Tuple[str, ...]): The metrics to evaluate, see _qbin_metrics.
+        num_jobs (int, optional): Number of jobs to evaluate the Qs in parallel using joblib.Parallel. Defaults to
+            None, which evaluates them sequentially.
+        metrics_cache (Dict, optional): Metrics keyed by _qbin_metrics_key. Only the metrics missing from it are
+            evaluated, and they are added to it. Defaults to None (every metric is evaluated).
+
+    Returns:
+        List[Dict[str, Dict[str, Any]]]: The results of _qbin_metrics for each Q, in order. With a metrics_cache they
+            are shared with the cache and can hold more metrics than requested.
+    """
+    if metrics_cache is None:
+        return Parallel(num_jobs)(delayed(_qbin_metrics)(*q_args, metric_names) for q_args in all_q_args)
+
+    keys = [_qbin_metrics_key(*q_args) for q_args in all_q_args]
+    missing = {}
+    for key, q_args in zip(keys, all_q_args):
+        missing_names = tuple(name for name in metric_names if name not in metrics_cache.get(key, {}))
+        if missing_names:
+            missing[key] = (*q_args, missing_names)
+    missing_results = Parallel(num_jobs)(delayed(_qbin_metrics)(*q_args) for q_args in missing.values())
+    for key, metrics in zip(missing, missing_results):
+        metrics_cache.setdefault(key, {}).update(metrics)
+    return [metrics_cache[key] for key in keys]
+
+
+class QBinComparisonData(NamedTuple):
+    """
+    The inputs of generate_fig_comparing_bins, with the names and order that function unpacks them in.
+
+    A plain list or tuple of the same values in the same order is also accepted.
+    """
+
+    uncertainty_error_pair: List[str]
+    model: str
+    dataset: str
+    targets: List[int]
+    all_values_q: List[int]
+    cmaps: List[str]
+    all_fitted_save_paths: List[str]
+    save_folder: str
+    save_file_preamble: str
+    combine_middle_bins: bool
+    save_figures_bool: bool
+    samples_as_dots_bool: bool
+    show_sample_info_mode: str
+    box_plot_error_lim: float
+    show_individual_target_plots: bool
+    interpret: bool
+    num_folds: int
+    ind_targets_to_show: List[int]
+    error_scaling_factor: float = 1.0
+
+
 def generate_fig_comparing_bins(
-    data: Tuple,
+    data: Union[QBinComparisonData, Tuple],
     display_settings: Dict[str, Any],
+    num_jobs: Optional[int] = None,
+    save_report: bool = False,
+    metrics_cache: Optional[Dict[Tuple, Dict[str, Dict[str, Any]]]] = None,
 ) -> None:
     """
     Generate figures comparing localization error, error bounds accuracy, and Jaccard index for different binning
     configurations.
 
     Args:
-        data (Tuple): A tuple containing various inputs needed to generate the figures. The tuple should include the following elements:
-            - uncertainty_error_pair (Tuple[float, float]): A tuple representing the mean and standard deviation of
-            the noise uncertainty used during training and evaluation.
+        data (Union[QBinComparisonData, Tuple]): The inputs needed to generate the figures, as a QBinComparisonData or a
+            tuple of the same elements in the same order:
+            - uncertainty_error_pair (List[str]): The uncertainty name, error column and uncertainty column to evaluate.
             - model (str): The name of the model being evaluated.
             - dataset (str): The name of the dataset being used.
             - targets (List[int]): A list of target indices being evaluated.
@@ -1570,6 +2062,19 @@ def generate_fig_comparing_bins(
         display_settings: Dictionary containing the following keys:
             - 'hatch': String representing the type of hatch pattern to use in the plots.
             - 'color': String representing the color to use for the plots.
+            - 'errors', 'error_bounds', 'jaccard': Booleans of whether to plot each metric. Metrics that are not
+              plotted are not evaluated.
+        num_jobs (int, optional): Number of jobs to evaluate the Qs, and to render the saved figures, in parallel using
+            joblib.Parallel. Defaults to None, which runs both sequentially.
+        save_report (bool, optional): Whether to save all the figures as the pages of a single PDF,
+            "<save_file_preamble>_qbin_report.pdf" in save_folder, instead of one PDF per figure. The pages are
+            rendered sequentially, and no report is saved without figures. Only used if saving figures. Defaults to
+            False.
+        metrics_cache (Dict, optional): Metrics of the Qs evaluated by earlier calls. Pass the same dictionary to
+            repeated calls, e.g. to re-make the figures with other display settings, and only the metrics it does not
+            hold are evaluated, and added to it. Its entries are keyed by the modification times of the binned
+            predictions, so bins saved again are evaluated again. The caller owns it and can clear it. Defaults to None
+            (every metric is evaluated).
 
     Returns:
         None.
@@ -1609,143 +2114,108 @@ def generate_fig_comparing_bins(
 
     # If combining the middle bins we just have the 2 edge bins, and the combined middle ones.
 
-    all_error_data = []
-    all_error_target_sep = []
-    all_bins_concat_targets_nosep_error = []
-    all_bins_concat_targets_sep_foldwise_error = []
-    all_bins_concat_targets_sep_all_error = []
-    all_jaccard_data = []
-    all_recall_data = []
-    all_precision_data = []
-    all_bins_concat_targets_sep_foldwise_jacc = []
-    all_bins_concat_targets_sep_all_jacc = []
-    all_bound_data = []
-    all_bins_concat_targets_sep_foldwise_errorbound = []
-    all_bins_concat_targets_sep_all_errorbound = []
-
-    for idx, num_bins in enumerate(all_values_q):
-        saved_bins_path_pre = all_fitted_save_paths[idx]
-
-        bins_all_targets, bins_targets_sep, bounds_all_targets, bounds_targets_sep = generate_struct_for_qbin(
-            model_list, targets, saved_bins_path_pre, dataset
-        )
-
-        # Get mean errors bin-wise, get all errors concatenated together bin-wise, and seperate by target.
-        all_error_data_dict = get_mean_errors(
-            bins_all_targets,
-            uncertainty_error_pair_list,
-            num_bins,
-            targets,
-            num_folds=num_folds,
-            error_scaling_factor=error_scaling_factor,
-            combine_middle_bins=combine_middle_bins,
-        )
-        all_error_data.append(all_error_data_dict["all mean error bins nosep"])
-        all_error_target_sep.append(all_error_data_dict["all mean error bins targets sep"])
-
-        all_bins_concat_targets_nosep_error.append(
-            all_error_data_dict["all error concat bins targets nosep"]
-        )  # shape is [num bins]
-        all_bins_concat_targets_sep_foldwise_error.append(
-            all_error_data_dict["all error concat bins targets sep foldwise"]
-        )  # shape is [num targets][num bins]
-        all_bins_concat_targets_sep_all_error.append(
-            all_error_data_dict["all error concat bins targets sep all"]
-        )  # same as all_bins_concat_targets_sep_foldwise but folds are flattened to a single list
-
-        all_jaccard_data_dict = evaluate_jaccard(
-            bins_all_targets,
-            uncertainty_error_pair_list,
-            num_bins,
-            targets,
-            num_folds=num_folds,
-            combine_middle_bins=combine_middle_bins,
-        )
-        all_jaccard_data.append(all_jaccard_data_dict["Jaccard All"])
-        all_recall_data.append(all_jaccard_data_dict["Recall All"])
-        all_precision_data.append(all_jaccard_data_dict["Precision All"])
-        all_bins_concat_targets_sep_foldwise_jacc.append(
-            all_jaccard_data_dict["all jacc concat bins targets sep foldwise"]
-        )  # shape is [num targets][num bins]
-        all_bins_concat_targets_sep_all_jacc.append(
-            all_jaccard_data_dict["all jacc concat bins targets sep all"]
-        )  # same as all_bins_concat_targets_sep_foldwise but folds are flattened to a single list
-
-        bound_return_dict = evaluate_bounds(
-            bounds_all_targets,
-            bins_all_targets,
-            uncertainty_error_pair_list,
-            num_bins,
-            targets,
-            num_folds,
-            combine_middle_bins=combine_middle_bins,
+    # Only evaluate the metrics that are plotted. Nothing is plotted, or returned, if not interpreting.
+    metric_names = tuple(name for name in ("errors", "jaccard", "error_bounds") if interpret and display_settings[name])
+    all_q_metrics = []
+    if metric_names:
+        # Get mean errors bin-wise, get all errors concatenated together bin-wise, and seperate by target. Also get the
+        # Jaccard indices and error bound accuracies. The Qs are independent, and cached results are reused.
+        all_q_metrics = _all_qbin_metrics(
+            [
+                (
+                    model_list,
+                    targets,
+                    saved_bins_path_pre,
+                    dataset,
+                    uncertainty_error_pair_list,
+                    num_bins,
+                    num_folds,
+                    error_scaling_factor,
+                    combine_middle_bins,
+                )
+                for num_bins, saved_bins_path_pre in zip(all_values_q, all_fitted_save_paths)
+            ],
+            metric_names,
+            num_jobs,
+            metrics_cache,
         )
 
-        all_bound_data.append(bound_return_dict["Error Bounds All"])
-        all_bins_concat_targets_sep_foldwise_errorbound.append(
-            bound_return_dict["all errorbound concat bins targets sep foldwise"]
-        )  # shape is [num targets][num bins]
-        all_bins_concat_targets_sep_all_errorbound.append(
-            bound_return_dict["all errorbound concat bins targets sep all"]
-        )  # same as all_bins_concat_targets_sep_foldwise but folds are flattened to a single list
-
     if interpret:
         # If we have combined the middle bins, we are only displaying 3 bins (outer edges, and combined middle bins).
         if combine_middle_bins:
             num_bins_display = 3
         else:
-            num_bins_display = num_bins
+            num_bins_display = all_values_q[-1]
 
         # Set x_axis labels for following plots.
         x_axis_labels = [str(x) for x in all_values_q]
         save_location = None
+        if save_figures_bool:
+            # Every figure file name starts with the folder and preamble, joined once
+            save_prefix = os.path.join(save_folder, save_file_preamble)
+        # Every figure is queued here and drawn at the end
+        plot_jobs = []
+
+        # Targets that get their own plots, selected once for the error, error bound and Jaccard plots.
+        if show_individual_target_plots:
+            shown_targets = set(ind_targets_to_show)
+            individual_targets = [
+                target_idx for target_idx in targets if ind_targets_to_show == [-1] or target_idx in shown_targets
+            ]
 
         # get error bounds
 
         if display_settings["errors"]:
+            # Collect the results of every Q, in Q order
+            all_error_data_dicts = [q_metrics["errors"] for q_metrics in all_q_metrics]
+            all_error_data = [error_dict["all mean error bins nosep"] for error_dict in all_error_data_dicts]
+            all_bins_concat_targets_nosep_error = [
+                error_dict["all error concat bins targets nosep"] for error_dict in all_error_data_dicts
+            ]  # shape is [num bins]
+            all_bins_concat_targets_sep_all_error = [
+                error_dict["all error concat bins targets sep all"] for error_dict in all_error_data_dicts
+            ]  # shape is [num targets][num bins], with the folds flattened to a single list
+
             # mean error concat for each bin
-            logger.info("mean error concat all L")
             if save_figures_bool:
                 if samples_as_dots_bool:
                     dotted_addition = "_dotted"
                 else:
                     dotted_addition = "_undotted"
-                save_location = os.path.join(
-                    save_folder, save_file_preamble + dotted_addition + "_error_all_targets.pdf"
+                save_location = f"{save_prefix}{dotted_addition}_error_all_targets.pdf"
+
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_bins_concat_targets_nosep_error,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Localization Error (mm)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=False,
+                    show_sample_info=show_sample_info_mode,
+                    show_individual_dots=samples_as_dots_bool,
+                    y_lim=box_plot_error_lim,
+                    to_log=True,
+                    save_path=save_location,
                 )
-
-            box_plot_comparing_q(
-                all_bins_concat_targets_nosep_error,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Localization Error (mm)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=False,
-                show_sample_info=show_sample_info_mode,
-                show_individual_dots=samples_as_dots_bool,
-                y_lim=box_plot_error_lim,
-                to_log=True,
-                save_path=save_location,
             )
 
             if show_individual_target_plots:
-                # plot the concatentated errors for each target seperately. Must transpose the iteration.
-                for target_idx in targets:
-                    target_data = [x[target_idx] for x in all_bins_concat_targets_sep_all_error]
+                # plot the concatentated errors for each target seperately. Must transpose the iteration, so the
+                # data of every Q is stacked into a (Q, target) array once and sliced per target.
+                error_by_q_target = np.asarray(all_bins_concat_targets_sep_all_error, dtype=object)
+                for target_idx in individual_targets:
+                    target_data = error_by_q_target[:, target_idx].tolist()
 
-                    if target_idx in ind_targets_to_show or ind_targets_to_show == [-1]:
-                        if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder,
-                                save_file_preamble + dotted_addition + "_error_target_" + str(target_idx) + ".pdf",
-                            )
+                    if save_figures_bool:
+                        save_location = f"{save_prefix}{dotted_addition}_error_target_{target_idx}.pdf"
 
-                        logger.info("individual error for T%s", target_idx)
-                        box_plot_comparing_q(
+                    plot_jobs.append(
+                        delayed(box_plot_comparing_q)(
                             target_data,
                             uncertainty_error_pair_list,
                             model_list,
@@ -1762,66 +2232,73 @@ def generate_fig_comparing_bins(
                             to_log=True,
                             save_path=save_location,
                         )
+                    )
 
             if save_figures_bool:
-                save_location = os.path.join(
-                    save_folder, save_file_preamble + dotted_addition + "mean_error_folds_all_targets.pdf"
+                save_location = f"{save_prefix}{dotted_addition}mean_error_folds_all_targets.pdf"
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_error_data,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Mean Error (mm)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=False,
+                    show_sample_info="None",
+                    show_individual_dots=False,
+                    y_lim=box_plot_error_lim,
+                    to_log=True,
+                    save_path=save_location,
                 )
-            box_plot_comparing_q(
-                all_error_data,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Mean Error (mm)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=False,
-                show_sample_info="None",
-                show_individual_dots=False,
-                y_lim=box_plot_error_lim,
-                to_log=True,
-                save_path=save_location,
             )
 
         # Plot Error Bound Accuracy
 
         if display_settings["error_bounds"]:
-            logger.info(" errorbound acc for all targets.")
-            if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_errorbound_all_targets.pdf")
+            bound_return_dicts = [q_metrics["error_bounds"] for q_metrics in all_q_metrics]
+            all_bound_data = [bound_dict["Error Bounds All"] for bound_dict in bound_return_dicts]
+            all_bins_concat_targets_sep_all_errorbound = [
+                bound_dict["all errorbound concat bins targets sep all"] for bound_dict in bound_return_dicts
+            ]  # shape is [num targets][num bins], with the folds flattened to a single list
 
-            box_plot_comparing_q(
-                all_bound_data,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Error Bound Accuracy (%)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=True,
-                show_sample_info="None",
-                show_individual_dots=False,
-                y_lim=100,
-                save_path=save_location,
+            if save_figures_bool:
+                save_location = f"{save_prefix}_errorbound_all_targets.pdf"
+
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_bound_data,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Error Bound Accuracy (%)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=True,
+                    show_sample_info="None",
+                    show_individual_dots=False,
+                    y_lim=100,
+                    save_path=save_location,
+                )
             )
 
             if show_individual_target_plots:
-                # plot the concatentated errors for each target seperately. Must transpose the iteration.
-                for target_idx in targets:
-                    target_data = [x[target_idx] for x in all_bins_concat_targets_sep_all_errorbound]
+                # plot the concatentated errors for each target seperately. Must transpose the iteration, so the
+                # data of every Q is stacked into a (Q, target) array once and sliced per target.
+                errorbound_by_q_target = np.asarray(all_bins_concat_targets_sep_all_errorbound, dtype=object)
+                for target_idx in individual_targets:
+                    target_data = errorbound_by_q_target[:, target_idx].tolist()
 
-                    if target_idx in ind_targets_to_show or ind_targets_to_show == [-1]:
-                        if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder, save_file_preamble + "_errorbound_target_" + str(target_idx) + ".pdf"
-                            )
+                    if save_figures_bool:
+                        save_location = f"{save_prefix}_errorbound_target_{target_idx}.pdf"
 
-                        logger.info("individual errorbound acc for T%s", target_idx)
-                        box_plot_comparing_q(
+                    plot_jobs.append(
+                        delayed(box_plot_comparing_q)(
                             target_data,
                             uncertainty_error_pair_list,
                             model_list,
@@ -1836,84 +2313,93 @@ def generate_fig_comparing_bins(
                             y_lim=100,
                             save_path=save_location,
                         )
+                    )
 
         # Plot Jaccard Index
         if display_settings["jaccard"]:
-            logger.info("Plot jaccard for all targets.")
-            if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_jaccard_all_targets.pdf")
+            all_jaccard_data_dicts = [q_metrics["jaccard"] for q_metrics in all_q_metrics]
+            all_jaccard_data = [jaccard_dict["Jaccard All"] for jaccard_dict in all_jaccard_data_dicts]
+            all_recall_data = [jaccard_dict["Recall All"] for jaccard_dict in all_jaccard_data_dicts]
+            all_precision_data = [jaccard_dict["Precision All"] for jaccard_dict in all_jaccard_data_dicts]
+            all_bins_concat_targets_sep_all_jacc = [
+                jaccard_dict["all jacc concat bins targets sep all"] for jaccard_dict in all_jaccard_data_dicts
+            ]  # shape is [num targets][num bins], with the folds flattened to a single list
 
-            box_plot_comparing_q(
-                all_jaccard_data,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Jaccard Index (%)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=True,
-                show_individual_dots=False,
-                y_lim=70,
-                save_path=save_location,
+            if save_figures_bool:
+                save_location = f"{save_prefix}_jaccard_all_targets.pdf"
+
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_jaccard_data,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Jaccard Index (%)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=True,
+                    show_individual_dots=False,
+                    y_lim=70,
+                    save_path=save_location,
+                )
             )
 
             # mean recall for each bin
-            logger.info("Plot recall for all targets.")
-
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_recall_jaccard_all_targets.pdf")
-            box_plot_comparing_q(
-                all_recall_data,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Ground Truth Bin Recall (%)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=True,
-                show_individual_dots=False,
-                y_lim=120,
-                save_path=save_location,
+                save_location = f"{save_prefix}_recall_jaccard_all_targets.pdf"
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_recall_data,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Ground Truth Bin Recall (%)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=True,
+                    show_individual_dots=False,
+                    y_lim=120,
+                    save_path=save_location,
+                )
             )
 
             # mean precision for each bin
-            logger.info("Plot precision for all targets.")
-
             if save_figures_bool:
-                save_location = os.path.join(save_folder, save_file_preamble + "_precision_jaccard_all_targets.pdf")
-            box_plot_comparing_q(
-                all_precision_data,
-                uncertainty_error_pair_list,
-                model_list,
-                hatch_type=hatch,
-                color=color,
-                x_axis_labels=x_axis_labels,
-                x_label="Q (# Bins)",
-                y_label="Ground Truth Bin Precision (%)",
-                num_bins_display=num_bins_display,
-                convert_to_percent=True,
-                show_individual_dots=False,
-                y_lim=120,
-                save_path=save_location,
+                save_location = f"{save_prefix}_precision_jaccard_all_targets.pdf"
+            plot_jobs.append(
+                delayed(box_plot_comparing_q)(
+                    all_precision_data,
+                    uncertainty_error_pair_list,
+                    model_list,
+                    hatch_type=hatch,
+                    color=color,
+                    x_axis_labels=x_axis_labels,
+                    x_label="Q (# Bins)",
+                    y_label="Ground Truth Bin Precision (%)",
+                    num_bins_display=num_bins_display,
+                    convert_to_percent=True,
+                    show_individual_dots=False,
+                    y_lim=120,
+                    save_path=save_location,
+                )
             )
 
             if show_individual_target_plots:
-                # plot the concatentated errors for each target seperately. Must transpose the iteration.
-                for target_idx in targets:
-                    target_data = [x[target_idx] for x in all_bins_concat_targets_sep_all_jacc]
+                # plot the concatentated errors for each target seperately. Must transpose the iteration, so the
+                # data of every Q is stacked into a (Q, target) array once and sliced per target.
+                jacc_by_q_target = np.asarray(all_bins_concat_targets_sep_all_jacc, dtype=object)
+                for target_idx in individual_targets:
+                    target_data = jacc_by_q_target[:, target_idx].tolist()
 
-                    if target_idx in ind_targets_to_show or ind_targets_to_show == [-1]:
-                        if save_figures_bool:
-                            save_location = os.path.join(
-                                save_folder, save_file_preamble + "jaccard_target_" + str(target_idx) + ".pdf"
-                            )
+                    if save_figures_bool:
+                        save_location = f"{save_prefix}jaccard_target_{target_idx}.pdf"
 
-                        logger.info("individual jaccard for T%s", target_idx)
-                        box_plot_comparing_q(
+                    plot_jobs.append(
+                        delayed(box_plot_comparing_q)(
                             target_data,
                             uncertainty_error_pair_list,
                             model_list,
@@ -1928,3 +2414,25 @@ def generate_fig_comparing_bins(
                             y_lim=70,
                             save_path=save_location,
                         )
+                    )
+
+        # The figures are independent, so saved figures are rendered in parallel. Shown figures, and the pages of the
+        # report, are drawn one after another in this process.
+        if not (save_figures_bool and save_report):
+            Parallel(num_jobs if save_figures_bool else None)(plot_jobs)
+        elif plot_jobs:
+            # The report is only opened to draw its pages, in order, so nothing is left open or empty on disk
+            with PdfPages(f"{save_prefix}_qbin_report.pdf") as report_pdf:
+                Parallel()(
+                    (plot_function, args, {**kwargs, "pdf_pages": report_pdf})
+                    for plot_function, args, kwargs in plot_jobs
+                )
+        # One summary line once the figures are drawn, rather than one line per queued figure
+        logger.info(
+            "Plotted %s figures comparing Q = %s of %s %s: %s.",
+            len(plot_jobs),
+            ", ".join(x_axis_labels),
+            model,
+            uncertainty_error_pair[0],
+            ", ".join(metric_names),
+        )
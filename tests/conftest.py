@@ -1,9 +1,13 @@
 # Global settings for tests. Run before any test
 import os
 
+import numpy as np
+import pandas as pd
 import pytest
 from scipy.io import loadmat
 
+from kale.interpret.uncertainty_quantiles import QBinComparisonData
+
 
 @pytest.fixture(scope="session")
 def download_path():
@@ -35,3 +39,55 @@ def landmark_uncertainty_tuples_path(download_path):
 
     dl_path = os.path.join(path_, "Uncertainty_tuples")
     return valid_path, test_path, dl_path
+
+
+# Saves synthetic quantile bins, in the layout read by generate_struct_for_qbin, for tests that need no download
+@pytest.fixture(scope="session")
+def synthetic_qbin_paths(tmp_path_factory):
+    """Predicted bins and estimated error bounds of U-NET on SA, for 2 targets and 4 folds, saved for Q = 2, 3, 5."""
+    rng = np.random.default_rng(36)
+    saved_bins_paths = {}
+    for num_bins in [2, 3, 5]:
+        saved_bins_path_pre = str(tmp_path_factory.mktemp("q%d" % num_bins))
+        bins_path = os.path.join(saved_bins_path_pre, "U-NET", "SA")
+        os.makedirs(bins_path)
+        for target_idx in [0, 1]:
+            predicted_bins = pd.DataFrame(
+                {"uid": ["s%d" % sample for sample in range(40)], "Testing Fold": np.arange(40) % 4}
+            )
+            error_bounds = pd.DataFrame({"fold": range(4)})
+            for uncertainty in ["S-MHA", "E-MHA"]:
+                predicted_bins[uncertainty + " Error"] = rng.exponential(2.0, 40)
+                predicted_bins[uncertainty + " Uncertainty bins"] = rng.integers(0, num_bins, 40)
+                error_bounds[uncertainty + " Uncertainty bounds"] = [
+                    str(np.sort(rng.uniform(0, 5, num_bins - 1)).tolist()) for _ in range(4)
+                ]
+            predicted_bins.to_csv(os.path.join(bins_path, "res_predicted_bins_t%d.csv" % target_idx), index=False)
+            error_bounds.to_csv(os.path.join(bins_path, "estimated_error_bounds_t%d.csv" % target_idx), index=False)
+        saved_bins_paths[num_bins] = saved_bins_path_pre
+    return saved_bins_paths
+
+
+@pytest.fixture
+def synthetic_qbin_comparison(synthetic_qbin_paths, tmp_path):
+    """Compares the S-MHA bins of every Q in synthetic_qbin_paths over all targets, saving the figures to tmp_path."""
+    return QBinComparisonData(
+        uncertainty_error_pair=["S-MHA", "S-MHA Error", "S-MHA Uncertainty"],
+        model="U-NET",
+        dataset="SA",
+        targets=[0, 1],
+        all_values_q=list(synthetic_qbin_paths),
+        cmaps=["#1f77b4", "#ff7f0e"],
+        all_fitted_save_paths=list(synthetic_qbin_paths.values()),
+        save_folder=str(tmp_path),
+        save_file_preamble="synthetic",
+        combine_middle_bins=False,
+        save_figures_bool=True,
+        samples_as_dots_bool=False,
+        show_sample_info_mode="None",
+        box_plot_error_lim=20,
+        show_individual_target_plots=False,
+        interpret=True,
+        num_folds=4,
+        ind_targets_to_show=[-1],
+    )
@@ -1,8 +1,10 @@
 import logging
 
+import numpy as np
+import pandas as pd
 import pytest
 
-from kale.evaluate.uncertainty_metrics import evaluate_bounds, evaluate_jaccard
+from kale.evaluate.uncertainty_metrics import bin_wise_bound_eval, evaluate_bounds, evaluate_jaccard, get_mean_errors
 from kale.prepdata.tabular_transform import generate_struct_for_qbin
 
 # from kale.utils.download import download_file_by_url
@@ -28,6 +30,42 @@ def dummy_test_preds(landmark_uncertainty_tuples_path):
     return bins_all_targets, bounds_all_targets
 
 
+@pytest.fixture(scope="module")
+def synthetic_test_preds(synthetic_qbin_paths):
+    bins_all_targets, bins_targets_sep, bounds_all_targets, bounds_targets_sep = generate_struct_for_qbin(
+        ["U-NET"], [0, 1], synthetic_qbin_paths[5], "SA"
+    )
+
+    return bins_all_targets, bounds_all_targets
+
+
+# The folds evaluated in parallel must give the same results, in the same order, as evaluating them sequentially
+class TestParallelFolds:
+    uncertainty_pairs = [["S-MHA", "S-MHA Error", "S-MHA Uncertainty"], ["E-MHA", "E-MHA Error", "E-MHA Uncertainty"]]
+
+    def test_evaluate_bounds(self, synthetic_test_preds):
+        bin_predictions, estimated_bounds = synthetic_test_preds
+        results = [
+            evaluate_bounds(estimated_bounds, bin_predictions, self.uncertainty_pairs, 5, [0, 1], 4, num_jobs=num_jobs)
+            for num_jobs in [None, 2]
+        ]
+        assert results[0] == results[1]
+
+    def test_get_mean_errors(self, synthetic_test_preds):
+        results = [
+            get_mean_errors(synthetic_test_preds[0], self.uncertainty_pairs, 5, [0, 1], 4, num_jobs=num_jobs)
+            for num_jobs in [None, 2]
+        ]
+        assert results[0] == results[1]
+
+    def test_evaluate_jaccard(self, synthetic_test_preds):
+        results = [
+            evaluate_jaccard(synthetic_test_preds[0], self.uncertainty_pairs, 5, [0, 1], 4, num_jobs=num_jobs)
+            for num_jobs in [None, 2]
+        ]
+        assert results[0] == results[1]
+
+
 class TestEvaluateJaccard:
     # Using one uncertainty type, test numerous bins
     @pytest.mark.parametrize("num_bins", [2, 3, 4, 5])
@@ -160,3 +198,70 @@ class TestEvaluateBounds:
             == len(all_bound_percents_notargetsep["U-NET E-MHA"][0])
             == 8 * 2
         )  # because each landmark has 8 folds - they are sep
+
+
+# A single fold of 3 bins with an empty bin (target 0, bin 2) and a bin index outside the bins (7), which is ignored.
+# The expected values follow the per-bin definition: the fraction of a bin's samples with lower < error <= upper.
+BOUND_SAMPLES = pd.DataFrame(
+    {
+        "uid": ["a", "b", "c", "d", "e", "f"],
+        "Testing Fold": 0,
+        "target_idx": [0, 0, 0, 0, 1, 1],
+        "S-MHA Error": [0.5, 1.5, 1.5, 5.0, 0.0, 10.0],
+        "S-MHA Uncertainty bins": [0, 0, 1, 7, 0, 2],
+    }
+)
+
+
+class TestBinWiseBoundEval:
+    def test_bin_accuracies(self):
+        bound_dict = bin_wise_bound_eval(
+            [[1.0, 2.0], [1.0, 3.0]],
+            BOUND_SAMPLES[["uid", "target_idx", "S-MHA Error"]],
+            BOUND_SAMPLES[["uid", "target_idx", "S-MHA Uncertainty bins"]],
+            [0, 1],
+            "S-MHA",
+            num_bins=3,
+        )
+
+        assert bound_dict["all bins concatenated targets seperated"] == [[[0.5], [1.0], [0.0]], [[0.0], [0.0], [1.0]]]
+        assert bound_dict["mean all"] == [[0.5, 0.0], [1.0, 0.0], [0.0, 1.0]]
+        # Weighted by the number of samples in each bin, so the empty bins do not count
+        assert bound_dict["mean all bins"] == pytest.approx([1 / 3, 1.0, 1.0])
+        assert bound_dict["mean all targets"] == pytest.approx((2 / 3 + 1 / 2) / 2)
+
+    def test_rows_in_different_order(self):
+        # Shuffle the predicted bins, so they must be aligned to the errors by uid and target
+        shuffled_bins = BOUND_SAMPLES[["uid", "target_idx", "S-MHA Uncertainty bins"]].sample(frac=1, random_state=seed)
+        assert not shuffled_bins["uid"].equals(BOUND_SAMPLES["uid"])
+
+        bound_dict = bin_wise_bound_eval(
+            [[1.0, 2.0], [1.0, 3.0]],
+            BOUND_SAMPLES[["uid", "target_idx", "S-MHA Error"]],
+            shuffled_bins,
+            [0, 1],
+            "S-MHA",
+            num_bins=3,
+        )
+
+        assert bound_dict["all bins concatenated targets seperated"] == [[[0.5], [1.0], [0.0]], [[0.0], [0.0], [1.0]]]
+        assert bound_dict["mean all bins"] == pytest.approx([1 / 3, 1.0, 1.0])
+
+    def test_combine_middle_bins(self):
+        estimated_bounds = pd.DataFrame(
+            {"fold": [0, 0], "target": [0, 1], "S-MHA Uncertainty bounds": ["[1.0, 2.0]", "[1.0, 3.0]"]}
+        )
+        bound_dict = evaluate_bounds(
+            {"U-NET Error Bounds": estimated_bounds},
+            {"U-NET": BOUND_SAMPLES},
+            [["S-MHA", "S-MHA Error", "S-MHA Uncertainty"]],
+            5,
+            [0, 1],
+            num_folds=1,
+            combine_middle_bins=True,
+        )
+
+        # Evaluated as 3 bins, reversed to worst to best
+        np.testing.assert_allclose(bound_dict["Error Bounds All"]["U-NET S-MHA"], [[1.0], [1.0], [1 / 3]])
+        assert bound_dict["all errorbound concat bins targets sep all"][0]["U-NET S-MHA"] == [[0.5], [1.0], [0.0]]
+        assert bound_dict["all errorbound concat bins targets sep all"][1]["U-NET S-MHA"] == [[0.0], [0.0], [1.0]]
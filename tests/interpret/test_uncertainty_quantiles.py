@@ -1,10 +1,16 @@
 import logging
+import os
+import re
+import shutil
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from kale.interpret.uncertainty_quantiles import quantile_binning_and_est_errors
+from kale.evaluate.uncertainty_metrics import evaluate_bounds, evaluate_jaccard, get_mean_errors
+from kale.interpret.uncertainty_quantiles import generate_fig_comparing_bins, quantile_binning_and_est_errors
 from kale.loaddata.tabular_access import load_csv_columns
+from kale.prepdata.tabular_transform import generate_struct_for_qbin
 
 # from kale.utils.download import download_file_by_url
 from kale.utils.seed import set_seed
@@ -18,6 +24,7 @@ set_seed(seed)
 
 ERRORS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
 UNCERTAINTIES = [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1]
+UNCERTAINTY_PAIR = ["S-MHA", "S-MHA Error", "S-MHA Uncertainty"]
 
 
 @pytest.fixture(scope="module")
@@ -47,3 +54,112 @@ class TestQuantileBinningAndEstErrors:
 
         assert pytest.approx(np.squeeze(est_bounds)) == UNCERTAINTIES[1:-1]
         assert pytest.approx(np.squeeze(est_errors)) == ERRORS[1:-1]
+
+
+ALL_METRICS = {"hatch": "o", "color": "b", "errors": True, "jaccard": True, "error_bounds": True}
+ERRORS_ONLY = {**ALL_METRICS, "jaccard": False, "error_bounds": False}
+ERRORS_AND_BOUNDS = {**ALL_METRICS, "jaccard": False}
+
+
+def evaluate_synthetic_qbins(num_bins, saved_bins_path_pre):
+    """Evaluates the S-MHA errors, Jaccard indices and error bound accuracies of the synthetic bins of one Q."""
+    bins_all_targets, _, bounds_all_targets, _ = generate_struct_for_qbin(["U-NET"], [0, 1], saved_bins_path_pre, "SA")
+    return {
+        "errors": get_mean_errors(bins_all_targets, [UNCERTAINTY_PAIR], num_bins, [0, 1], num_folds=4),
+        "jaccard": evaluate_jaccard(bins_all_targets, [UNCERTAINTY_PAIR], num_bins, [0, 1], num_folds=4),
+        "error_bounds": evaluate_bounds(bounds_all_targets, bins_all_targets, [UNCERTAINTY_PAIR], num_bins, [0, 1], 4),
+    }
+
+
+class TestGenerateFigComparingBins:
+    @pytest.mark.parametrize("num_jobs", [None, 2])
+    def test_parallel_qs(self, synthetic_qbin_comparison, synthetic_qbin_paths, num_jobs):
+        metrics_cache = {}
+        generate_fig_comparing_bins(
+            synthetic_qbin_comparison, ALL_METRICS, num_jobs=num_jobs, metrics_cache=metrics_cache
+        )
+
+        assert sorted(os.listdir(synthetic_qbin_comparison.save_folder)) == [
+            "synthetic_errorbound_all_targets.pdf",
+            "synthetic_jaccard_all_targets.pdf",
+            "synthetic_precision_jaccard_all_targets.pdf",
+            "synthetic_recall_jaccard_all_targets.pdf",
+            "synthetic_undotted_error_all_targets.pdf",
+            "synthetic_undottedmean_error_folds_all_targets.pdf",
+        ]
+        # One entry per Q, added in Q order, holding the metrics of evaluating the bins of that Q on their own
+        np.testing.assert_equal(
+            list(metrics_cache.values()),
+            [evaluate_synthetic_qbins(*q_paths) for q_paths in synthetic_qbin_paths.items()],
+        )
+
+    def test_cached_and_missing_metrics(self, synthetic_qbin_comparison, synthetic_qbin_paths):
+        metrics_cache = {}
+        first_qs = synthetic_qbin_comparison._replace(
+            all_values_q=[2, 3], all_fitted_save_paths=[synthetic_qbin_paths[2], synthetic_qbin_paths[3]]
+        )
+        generate_fig_comparing_bins(first_qs, ERRORS_ONLY, metrics_cache=metrics_cache)
+        assert [set(q_metrics) for q_metrics in metrics_cache.values()] == [{"errors"}, {"errors"}]
+        cached_errors = [q_metrics["errors"] for q_metrics in metrics_cache.values()]
+
+        # The cached Qs only evaluate the missing metrics, and the last Q evaluates all of them, in parallel
+        generate_fig_comparing_bins(synthetic_qbin_comparison, ALL_METRICS, num_jobs=2, metrics_cache=metrics_cache)
+
+        all_q_metrics = list(metrics_cache.values())
+        assert len(all_q_metrics) == 3
+        assert all_q_metrics[0]["errors"] is cached_errors[0] and all_q_metrics[1]["errors"] is cached_errors[1]
+        np.testing.assert_equal(
+            all_q_metrics, [evaluate_synthetic_qbins(*q_paths) for q_paths in synthetic_qbin_paths.items()]
+        )
+
+    def test_cache_invalidated_by_modified_bins(
+        self, synthetic_qbin_comparison, synthetic_qbin_paths, tmp_path_factory
+    ):
+        saved_bins_path_pre = str(tmp_path_factory.mktemp("modified") / "q3")
+        shutil.copytree(synthetic_qbin_paths[3], saved_bins_path_pre)
+        data = synthetic_qbin_comparison._replace(all_values_q=[3], all_fitted_save_paths=[saved_bins_path_pre])
+
+        metrics_cache = {}
+        generate_fig_comparing_bins(data, ERRORS_ONLY, metrics_cache=metrics_cache)
+        first = list(metrics_cache.values())
+        # Unchanged bins are not evaluated again
+        generate_fig_comparing_bins(data, ERRORS_ONLY, metrics_cache=metrics_cache)
+        assert len(metrics_cache) == 1 and list(metrics_cache.values())[0] is first[0]
+
+        # Save the bins again, with a later modification time
+        bins_file = os.path.join(saved_bins_path_pre, "U-NET", "SA", "res_predicted_bins_t0.csv")
+        predicted_bins = pd.read_csv(bins_file)
+        predicted_bins["S-MHA Error"] *= 2
+        predicted_bins.to_csv(bins_file, index=False)
+        modified_ns = os.stat(bins_file).st_mtime_ns + 10**9
+        os.utime(bins_file, ns=(modified_ns, modified_ns))
+
+        generate_fig_comparing_bins(data, ERRORS_ONLY, metrics_cache=metrics_cache)
+        assert len(metrics_cache) == 2
+        np.testing.assert_equal(
+            list(metrics_cache.values())[1]["errors"], evaluate_synthetic_qbins(3, saved_bins_path_pre)["errors"]
+        )
+
+    def test_save_report(self, synthetic_qbin_comparison):
+        generate_fig_comparing_bins(synthetic_qbin_comparison, ERRORS_AND_BOUNDS, save_report=True)
+
+        save_folder = synthetic_qbin_comparison.save_folder
+        assert os.listdir(save_folder) == ["synthetic_qbin_report.pdf"]
+        with open(os.path.join(save_folder, "synthetic_qbin_report.pdf"), "rb") as report:
+            assert len(re.findall(rb"/Type /Page\b(?!s)", report.read())) == 3
+
+    def test_no_report_without_figures(self, synthetic_qbin_comparison, tmp_path_factory):
+        generate_fig_comparing_bins(
+            synthetic_qbin_comparison,
+            {**ALL_METRICS, "errors": False, "jaccard": False, "error_bounds": False},
+            save_report=True,
+        )
+        assert os.listdir(synthetic_qbin_comparison.save_folder) == []
+
+        # A failed evaluation leaves no report behind
+        missing_bins = synthetic_qbin_comparison._replace(
+            all_values_q=[3], all_fitted_save_paths=[str(tmp_path_factory.mktemp("missing"))]
+        )
+        with pytest.raises(FileNotFoundError):
+            generate_fig_comparing_bins(missing_bins, ERRORS_AND_BOUNDS, save_report=True)
+        assert os.listdir(synthetic_qbin_comparison.save_folder) == []